@@ -7,3 +7,6 @@ from .decorators import auto, datafile, sync
 from .hooks import disabled as frozen
 from .manager import Missing
 from .model import Model
+from .session import Session
+from .types import Ref
+from .writer import flush
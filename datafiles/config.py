@@ -2,7 +2,7 @@
 
 from contextlib import suppress
 from dataclasses import dataclass
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 from .converters import Converter
 
@@ -14,6 +14,13 @@ class Meta:
     datafile_manual: bool = False
     datafile_defaults: bool = False
     datafile_infer: bool = False
+    datafile_readonly: bool = False
+    datafile_write_behind: bool = False
+    datafile_stat_ttl: float = 0.0
+    datafile_hooks: str = "methods"
+    datafile_stamp: bool = False
+    datafile_groups: Optional[Dict[str, List[str]]] = None
+    datafile_lean: bool = False
 
 
 def load(obj) -> Meta:
@@ -29,5 +36,19 @@ def load(obj) -> Meta:
         meta.datafile_defaults = obj.Meta.datafile_defaults
     with suppress(AttributeError):
         meta.datafile_infer = obj.Meta.datafile_infer
+    with suppress(AttributeError):
+        meta.datafile_readonly = obj.Meta.datafile_readonly
+    with suppress(AttributeError):
+        meta.datafile_write_behind = obj.Meta.datafile_write_behind
+    with suppress(AttributeError):
+        meta.datafile_stat_ttl = obj.Meta.datafile_stat_ttl
+    with suppress(AttributeError):
+        meta.datafile_hooks = obj.Meta.datafile_hooks
+    with suppress(AttributeError):
+        meta.datafile_stamp = obj.Meta.datafile_stamp
+    with suppress(AttributeError):
+        meta.datafile_groups = obj.Meta.datafile_groups
+    with suppress(AttributeError):
+        meta.datafile_lean = obj.Meta.datafile_lean
 
     return meta
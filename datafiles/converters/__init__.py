@@ -9,12 +9,14 @@ from ruamel.yaml.comments import CommentedMap
 from ruamel.yaml.scalarfloat import ScalarFloat
 from ruamel.yaml.scalarstring import DoubleQuotedScalarString
 
+from ..types import Ref
 from ..utils import cached, subclasses
 from ._bases import Converter
 from .builtins import Boolean, Float, Integer, String
 from .containers import Dataclass, Dictionary, List, Set
 from .enumerations import Enumeration
 from .extensions import *  # pylint: disable=unused-wildcard-import
+from .references import Reference
 
 _REGISTRY: Dict[Union[type, str], type] = {}
 
@@ -139,6 +141,12 @@ def map_type(cls, *, name: str = "", item_cls: Optional[type] = None):
             if converter is None:
                 raise TypeError(f"Unsupported union type: {cls}")
 
+        elif cls.__origin__ is Ref:
+            model = cls.__args__[0]
+            if not isclass(model):
+                raise TypeError("Model class is required with 'Ref' annotation")
+            converter = Reference.of_model(model)
+
         elif issubclass(cls.__origin__, Converter):
             subtypes = [map_type(t) for t in cls.__args__]
             converter = cls.__origin__.as_generic(subtypes)
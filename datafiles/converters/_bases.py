@@ -1,4 +1,6 @@
-from typing import Any
+from typing import Any, Callable
+
+from ..utils import copy_data
 
 
 class Optional:
@@ -24,6 +26,9 @@ class Converter:  # pylint: disable=unused-argument
 
     TYPE: type = object
     DEFAULT: Any = NotImplemented
+    LITERAL: bool
+
+    _loader: Callable[[Any], Any]
 
     @classmethod
     def as_generic(cls, subtypes):
@@ -42,6 +47,38 @@ class Converter:  # pylint: disable=unused-argument
         attributes = {"DEFAULT": None}
         return type(name, bases, attributes)
 
+    @classmethod
+    def get_loader(cls) -> Callable[[Any], Any]:
+        """Build a function to convert data already known to match this type."""
+        try:
+            return cls.__dict__["_loader"]
+        except KeyError:
+            loader = cls._build_loader()
+            cls._loader = loader
+            return loader
+
+    @classmethod
+    def _build_loader(cls) -> Callable[[Any], Any]:
+        convert = cls.to_python_value
+        kind = cls.TYPE
+        if cls._is_literal():
+            # Subclasses (e.g. 'bool' or round-trip scalars) still need converting
+            return lambda data: (
+                data
+                if type(data) is kind  # pylint: disable=unidiomatic-typecheck
+                else convert(data, target_object=None)
+            )
+        return lambda data: convert(data, target_object=None)
+
+    @classmethod
+    def _is_literal(cls) -> bool:
+        for base in cls.__mro__:
+            if "LITERAL" in vars(base):
+                return vars(base)["LITERAL"]
+            if {"to_python_value", "to_preserialization_data"} & vars(base).keys():
+                return False
+        return False
+
     @classmethod
     def to_python_value(cls, deserialized_data, *, target_object=None):
         return cls.to_preserialization_data(deserialized_data)
@@ -52,6 +89,6 @@ class Converter:  # pylint: disable=unused-argument
             return cls.DEFAULT
 
         if cls.TYPE is object:
-            return python_value
+            return copy_data(python_value)
 
         return cls.TYPE(python_value)
@@ -10,6 +10,7 @@ class Boolean(Converter, int):
 
     TYPE = bool
     DEFAULT = False
+    LITERAL = True
     _FALSY = {"false", "f", "no", "n", "disabled", "off", "0"}
 
     @classmethod
@@ -26,6 +27,7 @@ class Float(Converter, float):
 
     TYPE = float
     DEFAULT = 0.0
+    LITERAL = True
 
 
 class Integer(Converter, int):
@@ -33,6 +35,7 @@ class Integer(Converter, int):
 
     TYPE = int
     DEFAULT = 0
+    LITERAL = True
 
     @classmethod
     def to_preserialization_data(cls, python_value, *, default_to_skip=None):
@@ -54,3 +57,4 @@ class String(Converter, str):
 
     TYPE = str
     DEFAULT = ""
+    LITERAL = True
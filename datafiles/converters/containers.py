@@ -1,12 +1,12 @@
 import dataclasses
 from collections.abc import Iterable
 from contextlib import suppress
-from typing import Callable, Dict
+from typing import Callable, Dict, Tuple
 
 import log
 
 from .. import settings
-from ..utils import Missing, get_default_field_value
+from ..utils import Missing, copy_data, get_default_field_value
 from ._bases import Converter
 
 
@@ -54,6 +54,18 @@ class List(Converter):
 
         return value
 
+    @classmethod
+    def _build_loader(cls):
+        convert = cls.to_python_value
+        load = cls.CONVERTER.get_loader()
+
+        def loader(data):
+            if isinstance(data, list) and (not data or data[0] is not None):
+                return [load(item) for item in data]
+            return convert(data, target_object=None)
+
+        return loader
+
     @classmethod
     def to_preserialization_data(cls, python_value, *, default_to_skip=None):
         data = []
@@ -68,7 +80,7 @@ class List(Converter):
             if isinstance(python_value, str):
                 data.append(convert(python_value, default_to_skip=None))
 
-            elif isinstance(python_value, set):
+            elif isinstance(python_value, (set, frozenset)):
                 data.extend(
                     sorted(convert(item, default_to_skip=None) for item in python_value)
                 )
@@ -91,6 +103,18 @@ class List(Converter):
 class Set(List):
     """Base converter for sets."""
 
+    @classmethod
+    def _build_loader(cls):
+        convert = cls.to_python_value
+        load = cls.CONVERTER.get_loader()
+
+        def loader(data):
+            if isinstance(data, list) and (not data or data[0] is not None):
+                return {load(item) for item in data}
+            return convert(data, target_object=None)
+
+        return loader
+
     @classmethod
     def to_python_value(cls, deserialized_data, *, target_object=None):
         if target_object is None or target_object is Missing:
@@ -152,9 +176,16 @@ class Dictionary(Converter):
 
         return value
 
+    @classmethod
+    def _build_loader(cls):
+        convert = cls.to_python_value
+        return lambda data: (
+            data.copy() if isinstance(data, dict) else convert(data, target_object=None)
+        )
+
     @classmethod
     def to_preserialization_data(cls, python_value, *, default_to_skip=None):
-        data = dict(python_value) if python_value else {}
+        data = {key: copy_data(value) for key, value in (python_value or {}).items()}
 
         if data == default_to_skip:
             data.clear()
@@ -168,6 +199,8 @@ class Dataclass(Converter):
     DATACLASS: Callable = NotImplemented
     CONVERTERS: Dict = NotImplemented
 
+    _plan: Tuple[Tuple[str, Callable, Callable], ...]
+
     @classmethod
     def of_mappings(cls, dataclass, converters: Dict[str, type]):
         name = f"{dataclass.__name__}Converter"
@@ -175,6 +208,36 @@ class Dataclass(Converter):
         attributes = {"DATACLASS": dataclass, "CONVERTERS": converters}
         return type(name, bases, attributes)
 
+    @classmethod
+    def get_plan(cls) -> Tuple[Tuple[str, Callable, Callable], ...]:
+        """Build the field conversion steps once per converter class."""
+        try:
+            return cls.__dict__["_plan"]
+        except KeyError:
+            plan = tuple(
+                (name, converter.to_python_value, converter.to_preserialization_data)
+                for name, converter in cls.CONVERTERS.items()
+            )
+            cls._plan = plan
+            return plan
+
+    @classmethod
+    def _build_loader(cls):
+        convert = cls.to_python_value
+        dataclass = cls.DATACLASS
+        plan = tuple(
+            (name, converter.get_loader()) for name, converter in cls.CONVERTERS.items()
+        )
+
+        def loader(data):
+            if isinstance(data, dict):
+                values = {name: load(data[name]) for name, load in plan if name in data}
+                with suppress(TypeError):
+                    return dataclass(**values)  # pylint: disable=not-callable
+            return convert(data, target_object=None)
+
+        return loader
+
     @classmethod
     def to_python_value(cls, deserialized_data, *, target_object=None):
         if dataclasses.is_dataclass(deserialized_data):
@@ -183,39 +246,43 @@ class Dataclass(Converter):
             ), "Expected dataclass instance, not class"
             data = dataclasses.asdict(deserialized_data)
         elif isinstance(deserialized_data, dict):
-            data = deserialized_data.copy()
+            data = deserialized_data
         else:
             data = {}
 
         if deserialized_data is None and cls.DEFAULT is None:
             return None
 
-        for name, value in list(data.items()):
-            if name not in cls.CONVERTERS:
-                log.debug(f"Removed unmapped nested file attribute: {name}")
-                data.pop(name)
+        for name in data.keys() - cls.CONVERTERS.keys():
+            log.debug(f"Removed unmapped nested file attribute: {name}")
+
+        initialized = target_object is not None and target_object is not Missing
 
-        for name, converter in cls.CONVERTERS.items():
-            log.debug(f"Converting '{name}' data with {converter}")
+        values = {}
+        for name, to_python_value, _ in cls.get_plan():
             if name in data:
-                converted = converter.to_python_value(data[name], target_object=None)
+                converted = to_python_value(data[name], target_object=None)
+            elif initialized:
+                converted = get_default_field_value(target_object, name)
+                if converted is Missing:
+                    converted = getattr(target_object, name)
             else:
-                if target_object is None or target_object is Missing:
-                    converted = converter.to_python_value(None, target_object=None)
-                else:
-                    converted = get_default_field_value(target_object, name)
-                    if converted is Missing:
-                        converted = getattr(target_object, name)
+                converted = to_python_value(None, target_object=None)
 
-            data[name] = converted
+            values[name] = converted
 
-        new_value = cls.DATACLASS(**data)  # pylint: disable=not-callable
+        new_value = cls.DATACLASS(**values)  # pylint: disable=not-callable
 
-        if target_object is None or target_object is Missing:
-            value = new_value
-        else:
+        if initialized:
             value = target_object
-            value.__dict__ = new_value.__dict__
+            try:
+                value.__dict__ = new_value.__dict__
+            except AttributeError:
+                for field in dataclasses.fields(new_value):
+                    converted = object.__getattribute__(new_value, field.name)
+                    object.__setattr__(value, field.name, converted)
+        else:
+            value = new_value
 
         return value
 
@@ -226,9 +293,12 @@ class Dataclass(Converter):
         if python_value is None and cls.DEFAULT is None:
             return None
 
-        for name, converter in cls.CONVERTERS.items():
+        mapping = isinstance(python_value, dict)
+        skipping = default_to_skip is not None and default_to_skip is not Missing
+
+        for name, _, to_preserialization_data in cls.get_plan():
 
-            if isinstance(python_value, dict):
+            if mapping:
                 try:
                     value = python_value[name]
                 except KeyError:
@@ -241,13 +311,14 @@ class Dataclass(Converter):
                     log.debug(f"Added missing nested attribute: {name}")
                     value = None
 
-            with suppress(AttributeError):
-                if value == getattr(default_to_skip, name):
+            if skipping:
+                default = getattr(default_to_skip, name, Missing)
+                if default is not Missing and value == default:
                     log.debug(
-                        f"Skipped default value of {value!r} for {name!r} attribute"
+                        "Skipped default value of %r for %r attribute", value, name
                     )
                     continue
 
-            data[name] = converter.to_preserialization_data(value)
+            data[name] = to_preserialization_data(value)
 
         return data
@@ -22,6 +22,7 @@ class Text(String):
     """Converter for multiline strings."""
 
     DEFAULT = ""
+    LITERAL = False
 
     @classmethod
     def to_python_value(cls, deserialized_data, *, target_object=None):
@@ -0,0 +1,72 @@
+# pylint: disable=unused-argument,protected-access
+
+import dataclasses
+from typing import Any, Tuple, Type
+
+from ..pattern import get_pattern
+from ..types import Missing, Ref
+from ._bases import Converter
+
+
+class Reference(Converter):
+    """Base converter for references stored as another model's path values."""
+
+    MODEL: Type[Any] = object
+    DEFAULT = None
+
+    _names: Tuple[str, ...]
+
+    @classmethod
+    def of_model(cls, model: type):
+        name = f"{model.__name__}{cls.__name__}"
+        bases = (cls,)
+        attributes = {"MODEL": model}
+        return type(name, bases, attributes)
+
+    @classmethod
+    def get_names(cls) -> Tuple[str, ...]:
+        """Get the placeholder fields that identify an object, once per converter."""
+        try:
+            return cls.__dict__["_names"]
+        except KeyError:
+            pattern = get_pattern(cls.MODEL, cls.MODEL.Meta.datafile_pattern)
+            names = tuple(
+                field.name
+                for field in dataclasses.fields(cls.MODEL)
+                if field.name in pattern.placeholders
+            )
+            cls._names = names
+            return names
+
+    @classmethod
+    def to_python_value(cls, deserialized_data, *, target_object=None):
+        if deserialized_data is None:
+            return None
+
+        value = Ref(cls.MODEL, cls._get_key(deserialized_data))
+        if target_object is not None and target_object is not Missing:
+            if value == target_object:
+                return target_object
+
+        return value
+
+    @classmethod
+    def to_preserialization_data(cls, python_value, *, default_to_skip=None):
+        if python_value is None:
+            return None
+
+        key = cls._get_key(python_value)
+        if len(key) == 1:
+            return key[0][1]
+        return dict(key)
+
+    @classmethod
+    def _get_key(cls, value: Any) -> Tuple[Tuple[str, Any], ...]:
+        names = cls.get_names()
+        if isinstance(value, Ref):
+            return value._key
+        if isinstance(value, cls.MODEL):
+            return tuple((name, getattr(value, name)) for name in names)
+        if isinstance(value, dict):
+            return tuple((name, value.get(name)) for name in names)
+        return ((names[0], value),)
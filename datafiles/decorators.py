@@ -4,6 +4,7 @@ from typing import Callable, Dict, Optional, Union
 
 import log
 
+from . import config
 from .config import Meta
 from .converters import Converter
 from .model import Model, create_model
@@ -16,6 +17,7 @@ def datafile(
     manual: bool = Meta.datafile_manual,
     defaults: bool = Meta.datafile_defaults,
     infer: bool = Meta.datafile_infer,
+    readonly: bool = Meta.datafile_readonly,
     **kwargs,
 ):
     """Synchronize a data class to the specified path."""
@@ -30,6 +32,8 @@ def datafile(
         if dataclasses.is_dataclass(cls):
             dataclass = cls
         else:
+            if readonly or config.load(cls).datafile_readonly:
+                kwargs.setdefault("frozen", True)
             dataclass = dataclasses.dataclass(cls, **kwargs)
 
         return create_model(
@@ -39,6 +43,7 @@ def datafile(
             manual=manual,
             defaults=defaults,
             infer=infer,
+            readonly=readonly,
         )
 
     return decorator
@@ -1,15 +1,28 @@
 # pylint: disable=import-outside-toplevel
 
+import copy
 import json
+import re
 from abc import ABCMeta, abstractmethod
 from contextlib import suppress
 from io import StringIO
 from pathlib import Path
-from typing import IO, Dict, List, Union
+from typing import IO, Any, Collection, Dict, List, Optional, Tuple, Union
 
 import json5
 import log
 from ruamel.yaml import YAML as _YAML
+from ruamel.yaml.anchor import Anchor
+from ruamel.yaml.comments import CommentedMap
+from ruamel.yaml.error import YAMLError
+from ruamel.yaml.events import (
+    AliasEvent,
+    CollectionEndEvent,
+    CollectionStartEvent,
+    MappingStartEvent,
+    NodeEvent,
+    ScalarEvent,
+)
 
 from . import types, utils
 
@@ -21,9 +34,34 @@ def register(extension: str, formatter: type):
     _REGISTRY[extension] = formatter
 
 
+class Cache:
+    """Previously serialized state used to serialize only what changed."""
+
+    def __init__(self, text: str = ""):
+        self.text = text
+        self.document: Any = None
+        self.entries: Dict[Any, Tuple[Any, bool, str]] = {}
+
+    def __repr__(self) -> str:
+        return f"<Cache: {len(self.entries)} entries>"
+
+    def changed(self, key, value, first: bool = False) -> bool:
+        """Determine if a top-level value differs from when it was cached."""
+        try:
+            previous, was_first, _text = self.entries[key]
+        except KeyError:
+            return True
+        return was_first != first or previous != value
+
+    def store(self, key, value, first: bool = False, text: str = ""):
+        self.entries[key] = copy.deepcopy(value), first, text
+
+
 class Formatter(metaclass=ABCMeta):
     """Base class for object serialization and text deserialization."""
 
+    COMMENT: Optional[str] = None
+
     @classmethod
     @abstractmethod
     def extensions(cls) -> List[str]:
@@ -34,11 +72,36 @@ class Formatter(metaclass=ABCMeta):
     def deserialize(cls, file_object: IO) -> Dict:
         raise NotImplementedError
 
+    @classmethod
+    def deserialize_plain(cls, file_object: IO) -> Dict:
+        """Deserialize to built-in types without round-trip formatting details."""
+        return cls.deserialize(file_object)
+
+    @classmethod
+    def deserialize_keys(
+        cls, file_object: IO, keys: Collection[str], *, plain: bool = False
+    ) -> Dict:
+        """Deserialize only the given top-level keys, skipping others if possible."""
+        if plain:
+            data = cls.deserialize_plain(file_object)
+        else:
+            data = cls.deserialize(file_object)
+        if not isinstance(data, dict):
+            return data
+        return {key: value for key, value in data.items() if key in keys}
+
     @classmethod
     @abstractmethod
     def serialize(cls, data: Dict) -> str:
         raise NotImplementedError
 
+    @classmethod
+    def serialize_changes(
+        cls, data: Dict, cache: Cache  # pylint: disable=unused-argument
+    ) -> str:
+        """Serialize data, reusing the cached state where possible."""
+        return cls.serialize(data)
+
 
 class JSON(Formatter):
     """Formatter for JavaScript Object Notation."""
@@ -51,6 +114,14 @@ class JSON(Formatter):
     def deserialize(cls, file_object):
         return json.load(file_object)
 
+    @classmethod
+    def deserialize_keys(cls, file_object, keys, *, plain=False):
+        text = file_object.read()
+        try:
+            return _decode_json_keys(text, keys)
+        except (ValueError, IndexError):
+            return super().deserialize_keys(StringIO(text), keys, plain=plain)
+
     @classmethod
     def serialize(cls, data):
         return json.dumps(data, indent=2)
@@ -59,6 +130,8 @@ class JSON(Formatter):
 class JSON5(Formatter):
     """Formatter for "JSON for Humans" language."""
 
+    COMMENT = "//"
+
     @classmethod
     def extensions(cls):
         return {".json5"}
@@ -75,6 +148,8 @@ class JSON5(Formatter):
 class TOML(Formatter):
     """Formatter for (round-trip) Tom's Obvious Minimal Language."""
 
+    COMMENT = "#"
+
     @classmethod
     def extensions(cls):
         return {".toml"}
@@ -91,10 +166,80 @@ class TOML(Formatter):
 
         return tomlkit.dumps(data)
 
+    @classmethod
+    def serialize_changes(cls, data, cache):
+        import tomlkit
+
+        document = cache.document
+        if document is None:
+            document = tomlkit.loads(cache.text) if cache.text else tomlkit.document()
+            cache.document = document
+
+        for key in list(document.keys()):
+            if key not in data:
+                del document[key]
+                cache.entries.pop(key, None)
+
+        for key, value in data.items():
+            if cache.changed(key, value):
+                _patch_toml(document, key, value)
+                cache.store(key, value)
+
+        return tomlkit.dumps(document)
+
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+def _decode_json_keys(text: str, keys: Collection[str]) -> Dict:
+    decoder = json.JSONDecoder()
+    data: Dict = {}
+
+    index = _WHITESPACE.match(text).end()  # type: ignore
+    if text[index] != "{":
+        raise ValueError("Expected an object")
+    index = _WHITESPACE.match(text, index + 1).end()  # type: ignore
+
+    while text[index] != "}" and len(data) < len(keys):
+        key, index = decoder.raw_decode(text, index)
+        index = _WHITESPACE.match(text, index).end()  # type: ignore
+        if text[index] != ":":
+            raise ValueError("Expected ':' after key")
+        index = _WHITESPACE.match(text, index + 1).end()  # type: ignore
+
+        # Skipped values are still scanned, but never converted
+        value, index = decoder.raw_decode(text, index)
+        if key in keys:
+            data[key] = value
+
+        index = _WHITESPACE.match(text, index).end()  # type: ignore
+        if text[index] == ",":
+            index = _WHITESPACE.match(text, index + 1).end()  # type: ignore
+
+    return data
+
+
+def _patch_toml(container, key, value):
+    if key not in container:
+        container[key] = value
+        return
+
+    current = container[key]
+    if isinstance(value, dict) and isinstance(current, dict):
+        for name in list(current.keys()):
+            if name not in value:
+                del current[name]
+        for name, item in value.items():
+            _patch_toml(current, name, item)
+    elif current.unwrap() != value:
+        container[key] = value
+
 
 class YAML(Formatter):
     """Formatter for (round-trip) YAML Ain't Markup Language."""
 
+    COMMENT = "#"
+
     @classmethod
     def extensions(cls):
         return {"", ".yml", ".yaml"}
@@ -109,11 +254,34 @@ class YAML(Formatter):
             log.error(str(e))
             return {}
 
+    @classmethod
+    def deserialize_plain(cls, file_object):
+        yaml = _YAML(typ="safe")
+        return yaml.load(file_object)
+
+    @classmethod
+    def deserialize_keys(cls, file_object, keys, *, plain=False):
+        text = file_object.read()
+        try:
+            spans = _find_yaml_keys(text, keys)
+        except YAMLError:
+            spans = None
+
+        if spans is not None:
+            chunks = [text[start:end].rstrip("\n") + "\n" for start, end in spans]
+            load = cls.deserialize_plain if plain else cls.deserialize
+            with suppress(YAMLError):
+                return load(StringIO("".join(chunks)))
+
+        return super().deserialize_keys(StringIO(text), keys, plain=plain)
+
     @classmethod
     def serialize(cls, data):
         yaml = _YAML()
         yaml.register_class(types.List)
         yaml.register_class(types.Dict)
+        yaml.register_class(types.FrozenList)
+        yaml.register_class(types.FrozenDict)
         yaml.indent(mapping=2, sequence=4, offset=2)
 
         stream = StringIO()
@@ -128,29 +296,179 @@ class YAML(Formatter):
 
         return text.replace("- \n", "-\n")
 
-
-def deserialize(path: Path, extension: str, *, formatter=None) -> Dict:
+    @classmethod
+    def serialize_changes(cls, data, cache):
+        if (
+            not data
+            or (isinstance(data, CommentedMap) and data.fa.flow_style())
+            or _has_anchors(data)
+        ):
+            cache.entries.clear()
+            return cls.serialize(data)
+
+        for key in list(cache.entries):
+            if key not in data:
+                del cache.entries[key]
+
+        chunks = []
+        for index, (key, value) in enumerate(data.items()):
+            first = index == 0
+            if cache.changed(key, value, first):
+                chunk = CommentedMap()
+                chunk[key] = value
+                if isinstance(data, CommentedMap):
+                    if first:
+                        chunk.ca.comment = data.ca.comment
+                    if key in data.ca.items:
+                        chunk.ca.items[key] = data.ca.items[key]
+                cache.store(key, value, first, cls.serialize(chunk))
+            chunks.append(cache.entries[key][2])
+
+        return "".join(chunks)
+
+
+def _has_anchors(value: Any, seen: Optional[set] = None) -> bool:
+    """Determine if dumping a document would add anchors and aliases.
+
+    Aliases can refer to anchors in other top-level entries, so those entries
+    must be dumped together.
+    """
+    anchor = getattr(value, Anchor.attrib, None)
+    if anchor is not None and anchor.value:
+        return True
+
+    if isinstance(value, (dict, list)):
+        seen = set() if seen is None else seen
+        if id(value) in seen:
+            return True
+        seen.add(id(value))
+        items = value.values() if isinstance(value, dict) else value
+        return any(_has_anchors(item, seen) for item in items)
+
+    return False
+
+
+def _find_yaml_keys(text: str, keys: Collection[str]) -> Optional[List[Tuple]]:
+    """Locate the text of top-level block mapping keys using parser events.
+
+    Parsing stops once every requested key has been found, so values later in
+    the document are never scanned. Returns `None` if the document can't be
+    split into independent top-level entries.
+    """
+    spans: List[Tuple] = []
+    start = None
+    depth = 0
+    is_key = False
+
+    for event in _YAML().parse(text):
+        if depth == 1 and isinstance(event, NodeEvent):
+            is_key = not is_key
+            if is_key:
+                if not isinstance(event, ScalarEvent) or event.start_mark.column:
+                    return None
+                if start is not None:
+                    spans.append((start, event.start_mark.index))
+                    start = None
+                if len(spans) == len(keys):
+                    return spans
+                if event.value in keys:
+                    start = event.start_mark.index
+
+        if isinstance(event, AliasEvent) and start is not None:
+            return None
+
+        if isinstance(event, CollectionStartEvent):
+            if depth == 0 and (
+                not isinstance(event, MappingStartEvent) or event.flow_style
+            ):
+                return None
+            depth += 1
+        elif isinstance(event, CollectionEndEvent):
+            depth -= 1
+            if depth == 0:
+                if start is not None:
+                    spans.append((start, len(text)))
+                return spans
+
+    return spans
+
+
+def deserialize(
+    path: Path,
+    extension: str,
+    *,
+    formatter=None,
+    text: Optional[str] = None,
+    keys: Optional[Collection[str]] = None,
+    plain: bool = False,
+) -> Dict:
     if formatter is None:
         formatter = _get_formatter(extension)
-    with path.open("r") as file_object:
-        data = formatter.deserialize(file_object)
-        if data is None:
-            log.debug(f"No data in {path}")
-            data = {}
-        elif not isinstance(data, dict):
-            log.error(f"Invalid data in {path}: {data!r}")
-            data = {}
-        return data
+    if text is None:
+        text = path.read_text()
+    if keys is not None:
+        data = formatter.deserialize_keys(StringIO(text), keys, plain=plain)
+    elif plain:
+        data = formatter.deserialize_plain(StringIO(text))
+    else:
+        data = formatter.deserialize(StringIO(text))
+    if data is None:
+        log.debug(f"No data in {path}")
+        data = {}
+    elif not isinstance(data, dict):
+        log.error(f"Invalid data in {path}: {data!r}")
+        data = {}
+    return data
 
 
 def serialize(
-    data: Union[Dict, List], extension: str = ".yml", *, formatter=None
+    data: Union[Dict, List],
+    extension: str = ".yml",
+    *,
+    formatter=None,
+    cache: Optional[Cache] = None,
 ) -> str:
     if formatter is None:
         formatter = _get_formatter(extension)
+    if cache is not None and isinstance(data, dict):
+        return formatter.serialize_changes(data, cache)
     return formatter.serialize(data)
 
 
+STAMP = "datafiles:"
+
+
+def stamp(text: str, extension: str, schema: str) -> str:
+    """Append a comment recording the schema used to write the text."""
+    formatter = _get_formatter(extension)
+    if formatter.COMMENT is None:
+        return text
+    if text and not text.endswith("\n"):
+        text += "\n"
+    digest = utils.fingerprint(schema + text)
+    return f"{text}{formatter.COMMENT} {STAMP}{digest}\n"
+
+
+def unstamp(
+    text: str, extension: str, schema: Optional[str] = None
+) -> Tuple[str, bool]:
+    """Remove a schema stamp and determine if it matches the remaining text."""
+    formatter = _get_formatter(extension)
+    if formatter.COMMENT is None:
+        return text, False
+
+    prefix = f"{formatter.COMMENT} {STAMP}"
+    index = text.rfind(prefix)
+    if index == -1 or (index and text[index - 1] != "\n"):
+        return text, False
+    digest = text[index + len(prefix) :].rstrip()
+    if "\n" in digest:
+        return text, False
+
+    body = text[:index]
+    return body, schema is not None and digest == utils.fingerprint(schema + body)
+
+
 def _get_formatter(extension: str):
     with suppress(KeyError):
         return _REGISTRY[extension]
@@ -1,11 +1,20 @@
-from contextlib import contextmanager, suppress
-from dataclasses import is_dataclass
+from collections.abc import ItemsView, ValuesView
+from contextlib import contextmanager, nullcontext, suppress
+from contextvars import ContextVar
+from dataclasses import fields, is_dataclass
 from functools import wraps
+from itertools import count
+from types import MemberDescriptorType
+from typing import Any, FrozenSet, Iterable
+from weakref import WeakSet
 
 import log
 
 from . import settings, types
 from .mapper import create_mapper
+from .types import Missing
+from .utils import freeze
+from .writer import writer
 
 LOAD_BEFORE_METHODS = [
     "__getattribute__",
@@ -27,51 +36,224 @@ SAVE_AFTER_METHODS = [
     "popitem",
     "update",
 ]
+CONTAINER_METHODS = [
+    "get",
+    "values",
+    "items",
+    "__reversed__",
+]
+DESCRIBED = {"__getattribute__", "__setattr__"}
+SCALARS = {str, int, float, bool, type(None)}
 FLAG = "_patched"
 
+_ENABLED: ContextVar[bool] = ContextVar("datafiles_hooks_enabled", default=True)
+_EXCLUDED: ContextVar[FrozenSet[int]] = ContextVar(
+    "datafiles_hooks_excluded", default=frozenset()
+)
+SESSION: ContextVar[Any] = ContextVar("datafiles_session", default=None)
+
+_UNTRACKABLE: WeakSet = WeakSet()
+
+
+def patch(cls, descriptors: Iterable[str] = ()):
+    """Patch methods that get or set attributes, once per class.
+
+    When names are given, those fields are tracked with data descriptors
+    instead of patching `__getattribute__` and `__setattr__`.
+    """
+    if cls.__dict__.get(FLAG):
+        return
 
-def apply(instance, mapper):
-    """Path methods that get or set attributes."""
-    cls = instance.__class__
     log.debug(f"Patching methods on {cls}")
 
-    for method_name in LOAD_BEFORE_METHODS:
+    load_before_methods = LOAD_BEFORE_METHODS
+    save_after_methods = SAVE_AFTER_METHODS
+
+    if issubclass(cls, (list, dict)):
+        load_before_methods = load_before_methods + CONTAINER_METHODS
+
+    if descriptors:
+        for name in descriptors:
+            default = cls.__dict__.get(name, Missing)
+            setattr(cls, name, FieldHook(name, default, _get_slot(cls, name)))
+        load_before_methods = [m for m in load_before_methods if m not in DESCRIBED]
+        save_after_methods = [m for m in save_after_methods if m not in DESCRIBED]
+
+    for method_name in load_before_methods:
         with suppress(AttributeError):
             method = getattr(cls, method_name)
             modified_method = load_before(cls, method)
             setattr(cls, method_name, modified_method)
 
-    for method_name in SAVE_AFTER_METHODS:
+    for method_name in save_after_methods:
         with suppress(AttributeError):
             method = getattr(cls, method_name)
             modified_method = save_after(cls, method)
             setattr(cls, method_name, modified_method)
 
-    if is_dataclass(instance):
-        for attr_name in instance.datafile.attrs:  # type: ignore
-            attr = getattr(instance, attr_name)
-            if isinstance(attr, list):
-                attr = types.List(attr)
-                setattr(instance, attr_name, attr)
-            elif isinstance(attr, dict):
-                attr = types.Dict(attr)
-                setattr(instance, attr_name, attr)
-            elif not is_dataclass(attr):
-                continue
-            attr.datafile = create_mapper(attr, root=mapper)
-            apply(attr, mapper)
-
-    elif isinstance(instance, list):
-        for item in instance:
-            if is_dataclass(item):
-                item.datafile = create_mapper(item, root=mapper)  # type: ignore
-                apply(item, mapper)
-
-    elif isinstance(instance, dict):
-        for value in instance.values():
+    setattr(cls, FLAG, True)
+
+
+def apply(instance, mapper, *, values=False):
+    """Prepare an object for tracking; nested values are bound on first access.
+
+    With `values=True`, nested dataclasses already held by the object are bound
+    immediately so changes made through other references to them are saved.
+    """
+    if mapper and mapper.readonly:
+        freeze(instance)
+        return
+    cls = type(instance)
+    if mapper and mapper.descriptors and is_dataclass(cls):
+        datafile = instance.datafile  # type: ignore
+        names = [name for m in (datafile, *datafile.parts) for name in m.attrs]
+        patch(cls, names)
+    else:
+        patch(cls)
+    if values and mapper and is_dataclass(cls):
+        for name in (name for m in (mapper, *mapper.parts) for name in m.attrs):
+            with suppress(AttributeError):  # deferred fields are loaded later
+                _bind_nested(object.__getattribute__(instance, name), mapper.root)
+
+
+def bind(value, root):
+    """Attach a nested value to the root mapper responsible for saving it."""
+    current = get_mapper(value)
+    if current is not None and current.root is root:
+        return
+
+    # Patched classes hook '__class__' lookups, so avoid 'isinstance' on values
+    cls = type(value)
+    if is_dataclass(cls):
+        if current is None:
+            if cls in _UNTRACKABLE:
+                return
+            current = create_mapper(value, root=root)
+            try:
+                object.__setattr__(value, "datafile", current)
+            except AttributeError:
+                log.warning(
+                    f"Unable to track {cls} without '__dict__', "
+                    "changes are saved with the next change to its model"
+                )
+                _UNTRACKABLE.add(cls)
+                return
+        else:
+            current._root = root  # pylint: disable=protected-access
+        if root.descriptors:
+            patch(cls, current.attrs)
+        else:
+            patch(cls)
+    else:
+        object.__setattr__(value, "datafile", root)
+        patch(cls)
+
+
+def track(obj, method_name: str, args, value, mapper):
+    """Bind nested values returned from a patched method call."""
+    if type(value) in SCALARS:
+        return value
+
+    if method_name == "__getattribute__":
+        if args[0] in mapper.attrs and is_dataclass(type(obj)):
+            wrapped = _wrap(value)
+            if wrapped is not value:
+                _set_untracked(obj, args[0], wrapped)
+            return _bind(wrapped, mapper.root)
+
+    elif method_name == "__getitem__":
+        if isinstance(args[0], slice):
+            for item in value:
+                _bind(item, mapper.root)
+        else:
+            wrapped = _wrap(value)
+            if wrapped is not value:
+                base = list if isinstance(obj, list) else dict
+                base.__setitem__(obj, args[0], wrapped)
+            return _bind(wrapped, mapper.root)
+
+    elif method_name == "__iter__" and isinstance(obj, list):
+        return _track_items(obj, value, mapper.root, count())
+
+    elif method_name == "__reversed__" and isinstance(obj, list):
+        indexes = range(list.__len__(obj) - 1, -1, -1)
+        return _track_items(obj, value, mapper.root, indexes)
+
+    elif method_name == "get" and isinstance(obj, dict):
+        wrapped = _wrap(value)
+        if wrapped is not value and dict.get(obj, args[0], Missing) is value:
+            dict.__setitem__(obj, args[0], wrapped)
+        return _bind(wrapped, mapper.root)
+
+    elif method_name == "values" and isinstance(obj, dict):
+        # Views over the patched mapping bind each value as it is read
+        return ValuesView(obj)
+
+    elif method_name == "items" and isinstance(obj, dict):
+        return ItemsView(obj)
+
+    return value
+
+
+def _wrap(value):
+    cls = type(value)
+    if cls in SCALARS:
+        return value
+    if issubclass(cls, list) and not issubclass(cls, types.List):
+        return types.List(value)
+    if issubclass(cls, dict) and not issubclass(cls, types.Dict):
+        return types.Dict(value)
+    return value
+
+
+def _bind(value, root):
+    cls = type(value)
+    if cls in SCALARS:
+        return value
+    if issubclass(cls, (types.List, types.Dict)) or is_dataclass(cls):
+        bind(value, root)
+    return value
+
+
+def _bind_nested(value, root):
+    cls = type(value)
+    if cls in SCALARS:
+        return
+    if is_dataclass(cls):
+        bind(value, root)
+        for field in fields(cls):
             with suppress(AttributeError):
-                value.datafile = create_mapper(value, root=mapper)
-                apply(value, mapper)
+                _bind_nested(object.__getattribute__(value, field.name), root)
+    elif issubclass(cls, list):
+        for item in list.__iter__(value):
+            _bind_nested(item, root)
+    elif issubclass(cls, dict):
+        for item in dict.values(value):
+            _bind_nested(item, root)
+
+
+def _track_items(obj: list, iterator, root, indexes: Iterable[int]):
+    for index, item in zip(indexes, iterator):
+        wrapped = _wrap(item)
+        if wrapped is not item:
+            list.__setitem__(obj, index, wrapped)
+        yield _bind(wrapped, root)
+
+
+def _set_untracked(obj, name: str, value):
+    hook = type(obj).__dict__.get(name)
+    if isinstance(hook, FieldHook):
+        hook.store(obj, value)
+    else:
+        object.__setattr__(obj, name, value)
+
+
+def _get_slot(cls, name: str):
+    for base in cls.__mro__:
+        attribute = base.__dict__.get(name)
+        if isinstance(attribute, MemberDescriptorType):
+            return attribute
+    return None
 
 
 def load_before(cls, method):
@@ -80,18 +262,26 @@ def load_before(cls, method):
     if hasattr(method, FLAG):
         return method
 
+    named = method.__name__ in DESCRIBED
+
     @wraps(method)
     def wrapped(self, *args, **kwargs):
         __tracebackhide__ = settings.HIDDEN_TRACEBACK
 
         mapper = get_mapper(self)
+        if named and mapper is not None:
+            mapper = mapper.part(args[0])
+            if args[0] in mapper.deferred:
+                mapper.undefer()
         if enabled(mapper, args):
-            if mapper.exists and mapper.modified:
-                log.debug(f"Loading automatically before '{method.__name__}' call")
-                mapper.load()
-                mapper.save(_log=False)
+            refresh(mapper, f"'{method.__name__}' call", save=True)
 
-        return method(self, *args, **kwargs)
+        result = method(self, *args, **kwargs)
+
+        if mapper is not None:
+            result = track(self, method.__name__, args, result, mapper)
+
+        return result
 
     log.debug(f"Patched method to load before call: {cls.__name__}.{method.__name__}")
     setattr(wrapped, FLAG, True)
@@ -105,22 +295,25 @@ def save_after(cls, method):
     if hasattr(method, FLAG):
         return method
 
+    named = method.__name__ in DESCRIBED
+
     @wraps(method)
     def wrapped(self, *args, **kwargs):
         __tracebackhide__ = settings.HIDDEN_TRACEBACK
 
         mapper = get_mapper(self)
+        if named and mapper is not None:
+            mapper = mapper.part(args[0])
+            if args[0] in mapper.deferred:
+                mapper.undefer()
         if enabled(mapper, args):
-            if mapper.exists and mapper.modified:
-                log.debug(f"Loading automatically before '{method.__name__}' call")
-                mapper.load()
+            refresh(mapper, f"'{method.__name__}' call")
 
-        result = method(self, *args, **kwargs)
+        with locked(mapper):
+            result = method(self, *args, **kwargs)
 
         if enabled(mapper, args):
-            log.debug(f"Saving automatically after '{method.__name__}' call")
-            mapper.save()
-            mapper.load(_log=False)
+            persist(mapper, f"'{method.__name__}' call")
 
         return result
 
@@ -130,6 +323,125 @@ def save_after(cls, method):
     return wrapped
 
 
+class FieldHook:
+    """Data descriptor to load before getting and save after setting a field."""
+
+    def __init__(self, name: str, default: Any = Missing, slot: Any = None):
+        self.name = name
+        self.default = default
+        self.slot = slot
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            if self.default is Missing:
+                raise AttributeError(self.name)
+            return self.default
+
+        mapper = get_mapper(instance)
+        if mapper is not None:
+            mapper = mapper.part(self.name)
+            if self.name in mapper.deferred:
+                mapper.undefer()
+        if enabled(mapper, None):
+            refresh(mapper, f"getting '{self.name}'", save=True)
+
+        value = self.load(instance)
+
+        if mapper is not None:
+            wrapped = _wrap(value)
+            if wrapped is not value:
+                self.store(instance, wrapped)
+            value = _bind(wrapped, mapper.root)
+
+        return value
+
+    def __set__(self, instance, value):
+        mapper = get_mapper(instance)
+        if mapper is not None:
+            mapper = mapper.part(self.name)
+            if self.name in mapper.deferred:
+                mapper.undefer()
+        if enabled(mapper, None):
+            refresh(mapper, f"setting '{self.name}'")
+
+        with locked(mapper):
+            self.store(instance, value)
+
+        if enabled(mapper, None):
+            persist(mapper, f"setting '{self.name}'")
+
+    def __delete__(self, instance):
+        mapper = get_mapper(instance)
+        if mapper is not None:
+            mapper = mapper.part(self.name)
+            if self.name in mapper.deferred:
+                mapper.undefer()
+        if enabled(mapper, None):
+            refresh(mapper, f"deleting '{self.name}'")
+
+        with locked(mapper):
+            if self.slot:
+                self.slot.__delete__(instance)
+            else:
+                try:
+                    del instance.__dict__[self.name]
+                except KeyError:
+                    raise AttributeError(self.name) from None
+
+        if enabled(mapper, None):
+            persist(mapper, f"deleting '{self.name}'")
+
+    def load(self, instance):
+        """Get the stored value without hooks."""
+        if self.slot:
+            # The slot's own descriptor is shadowed by this hook on the class
+            # pylint: disable=unnecessary-dunder-call
+            return self.slot.__get__(instance, type(instance))
+        try:
+            return instance.__dict__[self.name]
+        except KeyError:
+            raise AttributeError(self.name) from None
+
+    def store(self, instance, value):
+        """Set the stored value without hooks."""
+        if self.slot:
+            # The slot's own descriptor is shadowed by this hook on the class
+            # pylint: disable=unnecessary-dunder-call
+            self.slot.__set__(instance, value)
+        else:
+            instance.__dict__[self.name] = value
+
+
+def refresh(mapper, action: str, *, save=False) -> None:
+    """Load the file if it changed since the object was last synchronized."""
+    if not mapper.dirty and mapper.exists and mapper.modified:
+        log.debug(f"Loading automatically before {action}")
+        mapper.load(_diff=True, _parts=False)
+        if save:
+            mapper.save(_log=False, _parts=False)
+
+
+def persist(mapper, action: str) -> None:
+    """Save the object, or defer the save to a session or background writer."""
+    session = SESSION.get()
+    if session:
+        log.debug(f"Deferring save after {action} to session")
+        session.track(mapper)
+    elif mapper.write_behind:
+        log.debug(f"Scheduling save after {action}")
+        mapper.schedule()
+    else:
+        log.debug(f"Saving automatically after {action}")
+        mapper.save(_reload=True, _parts=False)
+
+
+def locked(mapper):
+    """Keep background saves from serializing an object while it changes."""
+    if mapper is not None and mapper.write_behind:
+        return writer.lock
+    return nullcontext()
+
+
 def get_mapper(obj):
     try:
         return object.__getattribute__(obj, "datafile")
@@ -137,9 +449,14 @@ def get_mapper(obj):
         return None
 
 
+def active() -> bool:
+    """Determine if hooks are enabled in the current context."""
+    return settings.HOOKS_ENABLED and _ENABLED.get()
+
+
 def enabled(mapper, args) -> bool:
     """Determine if hooks are enabled for the current method."""
-    if not settings.HOOKS_ENABLED:
+    if not settings.HOOKS_ENABLED or not _ENABLED.get():
         return False
 
     if mapper is None:
@@ -148,6 +465,10 @@ def enabled(mapper, args) -> bool:
     if mapper.manual:
         return False
 
+    excluded = _EXCLUDED.get()
+    if excluded and id(mapper.root) in excluded:
+        return False
+
     if args and isinstance(args[0], str):
         if args[0] in {"Meta", "datafile"}:
             return False
@@ -158,16 +479,44 @@ def enabled(mapper, args) -> bool:
 
 
 @contextmanager
-def disabled(*objects):
-    """Globally disable method hooks, temporarily."""
-    enabled = settings.HOOKS_ENABLED
-    if enabled:
-        settings.HOOKS_ENABLED = False
+def disabled(*objects, only=False):
+    """Disable method hooks in the current context, temporarily.
+
+    Other threads and tasks are unaffected. With `only=True`, hooks are
+    disabled for the given objects alone. Either way, the objects are
+    saved when the context exits.
+    """
+    was_active = active()
+    if only:
+        mappers = [get_mapper(o) for o in objects]
+        context = excluded(*(m for m in mappers if m is not None))
+    else:
+        context = _disabled()
     try:
-        yield
+        with context:
+            yield
     finally:
-        settings.HOOKS_ENABLED = enabled
-        if enabled:
+        if was_active:
             for o in objects:
                 with suppress(AttributeError):
                     o.datafile.save()
+
+
+@contextmanager
+def _disabled():
+    token = _ENABLED.set(False)
+    try:
+        yield
+    finally:
+        _ENABLED.reset(token)
+
+
+@contextmanager
+def excluded(*mappers):
+    """Disable method hooks for specific objects in the current context."""
+    ids = {id(m.root) for m in mappers} | {id(p) for m in mappers for p in m.parts}
+    token = _EXCLUDED.set(_EXCLUDED.get() | ids)
+    try:
+        yield
+    finally:
+        _EXCLUDED.reset(token)
@@ -3,20 +3,24 @@
 from __future__ import annotations
 
 import dataclasses
-import inspect
 import os
+from contextlib import suppress
+from copy import copy
 from functools import reduce
 from glob import iglob
 from pathlib import Path
-from typing import TYPE_CHECKING, Iterator, Optional
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Set, Tuple
+from weakref import WeakValueDictionary
 
 import log
-from parse import parse
 from ruamel.yaml.error import MarkedYAMLError
 
-from . import hooks, model
+from . import config, hooks, model
+from .pattern import get_pattern
+from .types import Ref
 
 if TYPE_CHECKING:
+    from .mapper import Mapper
     from .model import Model
 
 
@@ -24,26 +28,64 @@ Trilean = Optional[bool]
 Missing = dataclasses._MISSING_TYPE  # sentinel value for arguments to be loaded
 Absent = object()  # sentinel value for required arguments not passed
 
-
-class Splats:
-    def __getattr__(self, name):
-        return "*"
+_SHARED: WeakValueDictionary = WeakValueDictionary()
 
 
 class Manager:
     def __init__(self, cls):
         self.model = cls
+        self._lazy = False
+        self._only: Optional[Tuple[str, ...]] = None
+        self._defer: Tuple[str, ...] = ()
+        self._prefetch: Tuple[str, ...] = ()
+
+    def lazy(self) -> Manager:
+        """Get a manager that defers reading files until a field is accessed."""
+        manager = copy(self)
+        manager._lazy = True
+        return manager
+
+    def only(self, *names: str) -> Manager:
+        """Get a manager that loads the given fields and defers all others."""
+        manager = copy(self)
+        manager._only = self._check_fields("only", names)
+        return manager
+
+    def defer(self, *names: str) -> Manager:
+        """Get a manager that defers loading the given fields until accessed."""
+        manager = copy(self)
+        manager._defer = self._defer + self._check_fields("defer", names)
+        return manager
+
+    def prefetch(self, *names: str) -> Manager:
+        """Get a manager that resolves references in the given fields together."""
+        manager = copy(self)
+        manager._prefetch = self._prefetch + self._check_fields("prefetch", names)
+        return manager
+
+    def _check_fields(self, method: str, names: Tuple[str, ...]) -> Tuple[str, ...]:
+        fields = {field.name for field in dataclasses.fields(self.model)}
+        for name in names:
+            if name not in fields:
+                raise TypeError(f"Manager.{method}() got an unknown field: '{name}'")
+        return names
 
     def get(self, *args, **kwargs) -> Model:
+        instance = self._get(*args, **kwargs)
+        if self._prefetch:
+            self._resolve([instance])
+        return instance
+
+    def _get(self, *args, **kwargs) -> Model:
         with hooks.disabled():
             instance = self.model.__new__(self.model)
 
             # Set initial values for all passed arguments
             fields = [field for field in dataclasses.fields(self.model) if field.init]
-            pattern = self.model.Meta.datafile_pattern
+            pattern = get_pattern(self.model, self.model.Meta.datafile_pattern)
             args_iter = iter(args)
+            passed = set()
             for field in fields:
-                placeholder = f"{{self.{field.name}}}"
 
                 try:
                     value = next(args_iter)
@@ -51,7 +93,7 @@ class Manager:
                     value = kwargs.get(field.name, Absent)
 
                 if (
-                    placeholder in pattern
+                    field.name in pattern.placeholders
                     and value is Absent
                     and isinstance(field.default, Missing)
                 ):
@@ -66,28 +108,93 @@ class Manager:
                         value = field.default_factory()
                     else:
                         value = Missing
+                else:
+                    passed.add(field.name)
                 object.__setattr__(instance, field.name, value)
 
             # Bypass calling load() because hooks are disabled currently
             model.Model.__post_init__(instance)
 
+            mapper = instance.datafile
+            deferred = self._get_deferred(mapper, passed)
+
+            # Unchanged read-only objects are shared instead of loaded again
+            key = self.model, mapper.path
+            shared = mapper.readonly and not deferred and passed <= pattern.placeholders
+            if shared:
+                with suppress(KeyError):
+                    existing = _SHARED[key]
+                    if not existing.datafile.modified:
+                        log.debug(f"Reusing read-only '{mapper.classname}' object")
+                        return existing
+
+            # Fields without loaded values must not shadow the hooks that load them
+            for name in deferred:
+                with suppress(AttributeError):
+                    object.__delattr__(instance, name)
+
+            if self._lazy:
+                if not mapper.exists:
+                    raise FileNotFoundError(f"No such file: '{mapper.relpath}'")
+                log.debug(f"Deferring load of '{mapper.classname}' object")
+                mapper.defer(deferred)
+                mapper.modified = False
+                return self._finish(instance)
+
             try:
-                instance.datafile.load(_first_load=True)
+                mapper.load(_first_load=True, _deferred=deferred)
             except MarkedYAMLError as e:
-                log.critical(
-                    f"Deleting invalid YAML: {instance.datafile.path} ({e.problem})"
-                )
-                instance.datafile.path.unlink()
-                instance.datafile.load()
+                log.critical(f"Deleting invalid YAML: {mapper.path} ({e.problem})")
+                mapper.path.unlink()
+                mapper.load()
+
+            # Loading all fields is required to reconstruct the dataclass, so
+            # objects with deferred fields never call '__post_init__'
+            if deferred:
+                return self._finish(instance)
 
             # Reconstruct the dataclass so that __init__ gets called
             instance = dataclasses.replace(instance)
 
             # Make sure the mapper knows that it's actually been loaded
             instance.datafile.modified = False
+            instance.datafile.adopt(mapper)
 
+            if shared:
+                with suppress(TypeError):
+                    _SHARED[key] = instance
+
+        return instance
+
+    def _get_deferred(self, mapper: Mapper, passed: Set[str]) -> Set[str]:
+        names = {
+            name
+            for m in (mapper, *mapper.parts)
+            for name in m.attrs
+            if name not in passed
+        }
+        if self._lazy:
+            return names
+        if self._only is not None:
+            return {name for name in names if name not in self._only}
+        return {name for name in names if name in self._defer}
+
+    @staticmethod
+    def _finish(instance: Model) -> Model:
+        hooks.apply(instance, instance.datafile)
         return instance
 
+    def _resolve(self, instances: List[Model]) -> None:
+        log.info(f"Prefetching references for {len(instances)} object(s)")
+        cache: Dict = {}
+        with hooks.disabled():
+            for name in self._prefetch:
+                for instance in instances:
+                    value = getattr(instance, name)
+                    for ref in value if isinstance(value, list) else [value]:
+                        if isinstance(ref, Ref):
+                            ref._resolve(cache)  # pylint: disable=protected-access
+
     def get_or_none(self, *args, **kwargs) -> Optional[Model]:
         try:
             return self.get(*args, **kwargs)
@@ -106,28 +213,12 @@ class Manager:
             return instance
 
     def all(self, *, _exclude: str = "") -> Iterator[Model]:
-        path = Path(self.model.Meta.datafile_pattern).expanduser()
-        if path.is_absolute() or self.model.Meta.datafile_pattern[:2] == "./":
-            log.debug(f"Detected static path pattern: {path}")
-        else:
-            log.debug(
-                f"Detected relative path pattern: {self.model.Meta.datafile_pattern}"
-            )
-            try:
-                root = Path(inspect.getfile(self.model)).parent
-            except (TypeError, OSError):
-                level = log.DEBUG if "__main__" in str(self.model) else log.WARNING
-                log.log(level, f"Unable to determine module for {self.model}")
-                root = Path.cwd()
-            path = root / self.model.Meta.datafile_pattern
-
-        pattern = alt_pattern = str(path.resolve())
-        for field in dataclasses.fields(self.model):
-            if not isinstance(field.default, Missing):
-                alt_pattern = alt_pattern.replace("{self." + field.name + "}", "")
-        splatted = pattern.format(self=Splats()).replace(
-            f"{os.sep}*{os.sep}", f"{os.sep}**{os.sep}"
-        )
+        pattern = get_pattern(self.model, self.model.Meta.datafile_pattern)
+        splatted = pattern.glob
+        groups = config.load(self.model).datafile_groups or {}
+        extension = os.path.splitext(pattern.pattern)[1]
+        suffixes = tuple(f".{group}{extension}" for group in groups)
+        instances: List[Model] = []
 
         log.info(f"Finding files matching pattern: {splatted}")
         for index, filename in enumerate(iglob(splatted, recursive=True)):
@@ -135,21 +226,25 @@ class Manager:
                 log.debug(f"Skipped matching directory {index + 1}: {filename}")
                 continue
 
-            log.debug(f"Found matching path {index + 1}: {filename}")
-            result = parse(pattern, filename) or parse(alt_pattern, filename)
-            if result:
-                values = list(result.named.values())
-
-                if len(values) > 1 and os.sep in values[-1]:
-                    parts = values[-1].rsplit(os.sep, 1)
-                    values[-2] = values[-2] + os.sep + parts[0]
-                    values[-1] = parts[1]
+            if suffixes and filename.endswith(suffixes):
+                log.debug(f"Skipped field group file {index + 1}: {filename}")
+                continue
 
+            log.debug(f"Found matching path {index + 1}: {filename}")
+            values = pattern.parse(filename)
+            if values is not None:
                 if _exclude and values[0].startswith(_exclude):
                     log.debug(f"Skipped loading of excluded value: {values[0]}")
                     continue
 
-                yield self.get(*values)
+                if self._prefetch:
+                    instances.append(self._get(*values))
+                else:
+                    yield self.get(*values)
+
+        if instances:
+            self._resolve(instances)
+            yield from instances
 
     def filter(self, *, _exclude: str = "", **query):
         for item in self.all(_exclude=_exclude):
@@ -2,23 +2,65 @@
 
 from __future__ import annotations
 
+import copy
 import dataclasses
-import inspect
 import os
-from contextlib import suppress
+import time
+from contextlib import contextmanager, nullcontext, suppress
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, FrozenSet, Iterable, Iterator, Mapping, Optional, Tuple
+from weakref import WeakKeyDictionary
 
 import log
-from cached_property import cached_property
 
-from . import config, formats, hooks
+from . import config, formats, hooks, settings
 from .converters import Converter, map_type
-from .types import Missing, Trilean
-from .utils import display, get_default_field_value, recursive_update, write
+from .pattern import get_pattern
+from .types import FrozenDict, FrozenList, Missing, Trilean
+from .utils import (
+    StatKey,
+    cached,
+    display,
+    fingerprint,
+    get_default_field_value,
+    is_ambiguous,
+    recursive_update,
+    stat,
+    write,
+)
+from .writer import writer
 
 
 class Mapper:
+    __slots__ = (
+        "_instance",
+        "_frozen",
+        "attrs",
+        "_pattern",
+        "_path",
+        "_manual",
+        "_readonly",
+        "defaults",
+        "_infer",
+        "_write_behind",
+        "_dirty",
+        "_transaction",
+        "_stat_ttl",
+        "_descriptors",
+        "_stamp",
+        "_lean",
+        "_deferred",
+        "_last_load",
+        "_last_check",
+        "_last_data",
+        "_last_cache",
+        "_last_hash",
+        "_root",
+        "_main",
+        "_parts",
+        "saves_skipped",
+    )
+
     def __init__(
         self,
         instance: Any,
@@ -28,7 +70,14 @@ class Mapper:
         manual: bool,
         defaults: bool,
         infer: bool,
+        readonly: bool = False,
+        write_behind: bool = False,
+        stat_ttl: float = 0.0,
+        descriptors: bool = False,
+        stamp: bool = False,
+        lean: bool = False,
         root: Optional[Mapper] = None,
+        main: Optional[Mapper] = None,
     ) -> None:
         assert manual is not None
         assert defaults is not None
@@ -39,85 +88,186 @@ class Mapper:
         )
         self.attrs = attrs
         self._pattern = pattern
-        self._manual = manual
+        self._path: Any = Missing
+        self._manual = manual or readonly
+        self._readonly = readonly
         self.defaults = defaults
         self._infer = infer
-        self._last_load = 0.0
+        self._write_behind = write_behind
+        self._dirty = False
+        self._transaction = False
+        self._stat_ttl = stat_ttl
+        self._descriptors = descriptors
+        self._stamp = stamp
+        self._lean = lean
+        self._deferred: FrozenSet[str] = frozenset()
+        self._last_load: Optional[StatKey] = None
+        self._last_check = 0
         self._last_data: Dict = {}
+        self._last_cache: Optional[formats.Cache] = None
+        self._last_hash: Optional[str] = None
         self._root = root
+        self._main = main
+        self._parts: Optional[Dict[str, Mapper]] = None
+        self.saves_skipped = 0
 
     @property
     def classname(self) -> str:
         return self._instance.__class__.__name__
 
-    @cached_property
+    @property
     def path(self) -> Optional[Path]:
+        if self._path is Missing:
+            self._path = self._get_path()
+        return self._path
+
+    def _get_path(self) -> Optional[Path]:
         if not self._pattern:
             return None
-
-        path = Path(self._pattern.format(self=self._instance)).expanduser()
-        if path.is_absolute() or self._pattern.startswith("./"):
-            log.debug(f"Detected static path pattern: {path}")
-            return path.resolve()
-
-        cls = self._instance.__class__
-        try:
-            root = Path(inspect.getfile(cls)).parent
-        except (TypeError, OSError):
-            level = log.DEBUG if "__main__" in str(cls) else log.WARNING
-            log.log(level, f"Unable to determine module for {cls}")
-            root = Path.cwd()
-
-        log.debug(f"Detected relative path pattern: {path}")
-        path = (root / path).resolve()
-        return path
+        return get_pattern(type(self._instance), self._pattern).format(self._instance)
 
     @property
     def relpath(self) -> Path:
+        assert self.path, "'pattern' must be set to get a relative path"
         return Path(os.path.relpath(self.path, Path.cwd()))
 
     @property
     def exists(self) -> bool:
         if self.path:
-            return self.path.exists()
+            return stat(self.path, self.stat_ttl) is not None
         return False
 
     @property
     def modified(self) -> bool:
         if self.path:
-            return self._last_load != self.path.stat().st_mtime
+            key = stat(self.path, self.stat_ttl)
+            if key is None or key != self._last_load:
+                return True
+            if self._last_hash and is_ambiguous(key, self._last_check):
+                elapsed = time.time_ns() - self._last_check
+                if elapsed >= self.stat_ttl * 1_000_000_000:
+                    return self._compare_text()
+            return False
         return True
 
     @modified.setter
     def modified(self, modified: bool):
         if modified:
-            self._last_load = 0.0
+            self._last_load = None
         else:
             assert self.path, "Cannot mark a missing file as unmodified"
-            self._last_load = self.path.stat().st_mtime
+            key = stat(self.path, self.stat_ttl)
+            if key is None:
+                raise FileNotFoundError(f"No such file: {self.path}")
+            self._last_load = key
+            self._last_check = time.time_ns()
+
+    def _compare_text(self) -> bool:
+        log.debug(f"Comparing text of recently modified file: {self.relpath}")
+        try:
+            text = self.path.read_text()  # type: ignore
+        except FileNotFoundError:
+            return True
+        if fingerprint(text) != self._last_hash:
+            return True
+        self._last_check = time.time_ns()
+        return False
+
+    @property
+    def root(self) -> Mapper:
+        return self._root or self
+
+    @property
+    def parts(self) -> Tuple[Mapper, ...]:
+        """Mappers for groups of fields stored in separate files."""
+        if self._parts:
+            return tuple(dict.fromkeys(self._parts.values()))
+        return ()
+
+    def part(self, name: str) -> Mapper:
+        """Get the mapper responsible for synchronizing a field."""
+        if self._parts:
+            return self._parts.get(name, self)
+        return self
 
     @property
     def manual(self) -> bool:
         return self._root.manual if self._root else self._manual
 
+    @property
+    def readonly(self) -> bool:
+        return self._root.readonly if self._root else self._readonly
+
     @property
     def infer(self) -> bool:
         return self._root.infer if self._root else self._infer
 
+    @property
+    def descriptors(self) -> bool:
+        return self._root.descriptors if self._root else self._descriptors
+
+    @property
+    def stamp(self) -> bool:
+        return self._root.stamp if self._root else self._stamp
+
+    @property
+    def lean(self) -> bool:
+        return self._root.lean if self._root else self._lean
+
+    @property
+    def stat_ttl(self) -> float:
+        return self._root.stat_ttl if self._root else self._stat_ttl
+
+    @property
+    def write_behind(self) -> bool:
+        if self._root:
+            return self._root.write_behind
+        return self._write_behind or settings.WRITE_BEHIND
+
+    @property
+    def deferred(self) -> FrozenSet[str]:
+        return self._deferred
+
+    def defer(self, names: Iterable[str]) -> None:
+        """Skip loading fields until one of them is first accessed."""
+        names = frozenset(names)
+        self._deferred = names.intersection(self.attrs)
+        for part in self.parts:
+            part.defer(names)
+
+    def undefer(self) -> None:
+        """Load all fields whose loading was deferred."""
+        names, self._deferred = self._deferred, frozenset()
+        if not names:
+            return
+
+        log.info(f"Loading deferred '{self.classname}' object from '{self.relpath}'")
+        data, _trusted = self._read()
+        self._set_values(data, names=None if self.infer else names)
+        self._loaded()
+
+    @property
+    def dirty(self) -> bool:
+        return self._root.dirty if self._root else self._dirty
+
     @property
     def data(self) -> Dict:
         with hooks.disabled():
             return self._get_data()
 
     def _get_data(self, include_default_values: Trilean = None) -> Dict:
-        log.debug(f"Preserializing object to data: {self._instance!r}")
+        log.debug("Preserializing object to data: %r", self._instance)
         if include_default_values is None:
             include_default_values = self.defaults
 
+        if self._deferred:
+            self.undefer()
+
+        data = self._last_data
+        if self.lean:
+            self._last_data = {}
         if self.infer:
-            data = recursive_update(self._last_data, self._instance.__dict__)
-        else:
-            data = recursive_update(self._last_data, dataclasses.asdict(self._instance))
+            data = recursive_update(data, self._instance.__dict__)
 
         for name in list(data.keys()):
             if name not in self.attrs:
@@ -125,32 +275,29 @@ class Mapper:
                 data.pop(name)
 
         for name, converter in self.attrs.items():
-            value = data[name]
+            if self.infer:
+                value = data[name]
+            else:
+                value = object.__getattribute__(self._instance, name)
+            default = get_default_field_value(self._instance, name)
 
             if getattr(converter, "DATACLASS", None):
                 log.debug(f"Converting '{name}' dataclass with {converter}")
                 new_value = converter.to_preserialization_data(
                     value,
-                    default_to_skip=(
-                        Missing
-                        if include_default_values
-                        else get_default_field_value(self._instance, name)
-                    ),
+                    default_to_skip=Missing if include_default_values else default,
                 )
-                data[name] = recursive_update(value, new_value)
+                data[name] = recursive_update(data.get(name), new_value)
 
-            elif (
-                value == get_default_field_value(self._instance, name)
-                and not include_default_values
-            ):
-                log.debug(f"Skipped default value of {value!r} for {name!r} attribute")
-                data.pop(name)
+            elif value == default and not include_default_values:
+                log.debug("Skipped default value of %r for %r attribute", value, name)
+                data.pop(name, None)
 
             else:
-                log.debug(f"Converting '{name}' value with {converter}: {value!r}")
+                log.debug("Converting %r value with %s: %r", name, converter, value)
                 data[name] = converter.to_preserialization_data(value)
 
-        log.debug(f"Preserialized object data: {data}")
+        log.debug("Preserialized object data: %s", data)
         return data
 
     @property
@@ -159,22 +306,44 @@ class Mapper:
 
     @text.setter
     def text(self, value: str):
+        self._check_writable()
+        if not self.path:
+            raise RuntimeError("'pattern' must be set to save the model")
         write(self.path, value.strip() + "\n", display=True)
 
+    def _check_writable(self) -> None:
+        if self.readonly:
+            raise RuntimeError(f"Cannot save read-only '{self.classname}' object")
+
     def _get_text(self, **kwargs) -> str:
         data = self._get_data(**kwargs)
+        return self._serialize(data)
+
+    def _serialize(self, data: Dict) -> str:
+        cache = self._last_cache or formats.Cache()
+        self._last_cache = None if self.lean else cache
         if self.path and self.path.suffix:
-            return formats.serialize(data, self.path.suffix)
-        return formats.serialize(data)
+            return formats.serialize(data, self.path.suffix, cache=cache)
+        return formats.serialize(data, cache=cache)
 
-    def load(self, *, _log=True, _first_load=False) -> None:
+    def load(
+        self,
+        *,
+        _log=True,
+        _first_load=False,
+        _deferred: Iterable[str] = (),
+        _diff=False,
+        _parts=True,
+    ) -> None:
         if self._frozen and not _first_load:
             raise dataclasses.FrozenInstanceError(
                 "Cannot load frozen dataclass instances more than once."
             )
 
         if self._root:
-            self._root.load(_log=_log, _first_load=_first_load)
+            self._root.load(
+                _log=_log, _first_load=_first_load, _diff=_diff, _parts=_parts
+            )
             return
 
         if self.path:
@@ -183,22 +352,114 @@ class Mapper:
         else:
             raise RuntimeError("'pattern' must be set to load the model")
 
-        data = formats.deserialize(self.path, self.path.suffix)
-        self._last_data = data
-        display(self.path, data)
+        previous, deferred = self._last_data, self._deferred
+        self._deferred = frozenset(_deferred).intersection(self.attrs)
+        names = frozenset(self.attrs) - self._deferred if self._deferred else None
+        data, trusted = self._read(names)
 
+        if _diff and previous and names is None:
+            names = deferred.union(
+                name
+                for name in previous.keys() | data.keys()
+                if previous.get(name, Missing) != data.get(name, Missing)
+            )
+            log.debug(f"Reloading changed fields: {sorted(names)}")
+
+        self._set_values(data, _first_load, names, trusted=_first_load and trusted)
+
+        self._loaded()
+
+        for part in self.parts if _parts else ():
+            part.load(
+                _log=_log, _first_load=_first_load, _deferred=_deferred, _diff=_diff
+            )
+
+    def _read(self, names: Optional[FrozenSet[str]] = None) -> Tuple[Dict, bool]:
+        if self._main and not self.exists:
+            log.debug(f"Reading grouped fields from '{self._main.relpath}'")
+            data = formats.deserialize(
+                self._main.path,  # type: ignore
+                self._main.path.suffix,  # type: ignore
+                keys=self.attrs.keys() if names is None else names,
+                plain=self.lean,
+            )
+            return data, False
+
+        path = self.path
+        assert path, "'pattern' must be set to read the model"
+        text = path.read_text()
+        schema = self._get_schema() if self.stamp else None
+        body, trusted = formats.unstamp(text, path.suffix, schema)
+        data = formats.deserialize(
+            path, path.suffix, text=body, keys=names, plain=self.lean
+        )
+        if not self.lean:
+            self._last_data = data
+            self._last_cache = formats.Cache(body)
+        self._last_hash = fingerprint(text)
+        display(path, data)
+        if trusted:
+            log.debug(f"Trusting stamped data in '{self.relpath}'")
+        return data, trusted
+
+    def _restore(self) -> None:
+        # Comments and formatting are only read again to save changes
+        with suppress(FileNotFoundError):
+            text = self.path.read_text()  # type: ignore
+            body, _trusted = formats.unstamp(text, self.path.suffix)  # type: ignore
+            self._last_data = formats.deserialize(
+                self.path, self.path.suffix, text=body  # type: ignore
+            )
+            self._last_cache = formats.Cache(body)
+
+    def _loaded(self) -> None:
+        # Grouped fields are read from the main file until their own is saved
+        if self._main is None or self.exists:
+            self.modified = False
+
+    def _get_schema(self) -> str:
+        return _get_schema(tuple(self.attrs.items()))
+
+    def _set_values(
+        self,
+        data: Dict,
+        first_load=False,
+        names: Optional[FrozenSet[str]] = None,
+        *,
+        trusted=False,
+    ) -> None:
         with hooks.disabled():
 
+            shared = True
             for name, value in data.items():
                 if name not in self.attrs and self.infer:
+                    if shared:
+                        self.attrs = dict(self.attrs)
+                        shared = False
                     self.attrs[name] = self._infer_attr(name, value)
 
             for name, converter in self.attrs.items():
-                self._set_value(self._instance, name, converter, data, _first_load)
+                if names is None or name in names:
+                    self._set_value(
+                        self._instance,
+                        name,
+                        converter,
+                        data,
+                        first_load,
+                        trusted=trusted,
+                    )
 
             hooks.apply(self._instance, self)
 
-        self.modified = False
+    def adopt(self, other: Mapper) -> None:
+        """Take over the last synchronized file state from another mapper."""
+        self._last_load = other._last_load
+        self._last_check = other._last_check
+        self._last_data = other._last_data
+        self._last_cache = other._last_cache
+        self._last_hash = other._last_hash
+        for part, other_part in zip(self.parts, other.parts):
+            part.adopt(other_part)
 
     @staticmethod
     def _infer_attr(name, value):
@@ -229,11 +490,14 @@ class Mapper:
         return map_type(cls, name=name)
 
     @staticmethod
-    def _set_value(instance, name, converter, data, first_load):
+    def _set_value(instance, name, converter, data, first_load, *, trusted=False):
         log.debug(f"Converting '{name}' data with {converter}")
 
         file_value = data.get(name, Missing)
-        init_value = getattr(instance, name, Missing)
+        try:
+            init_value = object.__getattribute__(instance, name)
+        except AttributeError:
+            init_value = Missing
         default_value = get_default_field_value(instance, name)
 
         if first_load:
@@ -245,9 +509,12 @@ class Mapper:
             )
 
             if init_value != default_value:
-                log.debug(f"Keeping non-default '{name}' init value: {init_value!r}")
+                log.debug("Keeping non-default %r init value: %r", name, init_value)
                 return
 
+        if isinstance(init_value, (FrozenList, FrozenDict, frozenset)):
+            init_value = Missing  # read-only containers are replaced, not updated
+
         if file_value is Missing:
             if default_value is Missing:
                 value = converter.to_python_value(None, target_object=init_value)
@@ -255,35 +522,157 @@ class Mapper:
                 value = converter.to_python_value(
                     default_value, target_object=init_value
                 )
+        elif trusted:
+            value = converter.get_loader()(file_value)
         else:
             value = converter.to_python_value(file_value, target_object=init_value)
 
-        log.debug(f"Setting '{name}' value: {value!r}")
+        log.debug("Setting %r value: %r", name, value)
         object.__setattr__(instance, name, value)
 
-    def save(self, *, include_default_values: Trilean = None, _log=True) -> None:
+    def save(
+        self,
+        *,
+        include_default_values: Trilean = None,
+        _log=True,
+        _reload=False,
+        _atomic=False,
+        _parts=True,
+    ) -> None:
         if self._root:
-            self._root.save(include_default_values=include_default_values, _log=_log)
+            self._root.save(
+                include_default_values=include_default_values,
+                _log=_log,
+                _reload=_reload,
+                _atomic=_atomic,
+                _parts=_parts,
+            )
             return
 
+        with writer.lock if self.write_behind else nullcontext():
+            rendered = self._render(include_default_values)
+            if rendered:
+                data, text, digest = rendered
+                if _log:
+                    log.info(f"Saving '{self.classname}' object to '{self.relpath}'")
+
+                path = self.path
+                assert path, "Rendered objects always have a path"
+                write(path, text, display=True, atomic=_atomic)
+                self._written(data, digest, reload=_reload)
+
+            if self._dirty:
+                writer.release(self)
+
+        for part in self.parts:
+            if _parts or not part.exists:
+                part.save(
+                    include_default_values=include_default_values,
+                    _log=_log,
+                    _reload=_reload,
+                    _atomic=_atomic,
+                )
+
+    def _render(
+        self, include_default_values: Trilean = None
+    ) -> Optional[Tuple[Dict, str, str]]:
+        self._check_writable()
         if self.path:
             if self.exists and self._frozen:
                 raise dataclasses.FrozenInstanceError(
                     f"Cannot save frozen dataclass instances which already exist, "
                     f"delete '{self.path}' before saving."
                 )
-            if _log:
-                log.info(f"Saving '{self.classname}' object to '{self.relpath}'")
         else:
             raise RuntimeError("'pattern' must be set to save the model")
 
+        if self._dirty:
+            writer.discard(self)
+
         with hooks.disabled():
-            text = self._get_text(include_default_values=include_default_values)
+            if self.lean:
+                self._restore()
+            data = self._get_data(include_default_values=include_default_values)
+            text = self._serialize(data)
+            if self.stamp:
+                text = formats.stamp(text, self.path.suffix, self._get_schema())
+
+        digest = fingerprint(text)
+        if digest == self._last_hash and self.exists and not self.modified:
+            log.debug(f"Skipped saving unchanged '{self.classname}' object")
+            self.saves_skipped += 1
+            return None
+
+        return data, text, digest
 
-        write(self.path, text, display=True)
+    def _written(self, data: Dict, digest: str, *, reload=False) -> None:
+        self._last_hash = digest
 
         self.modified = False
 
+        if reload:
+            log.debug(f"Refreshing '{self.classname}' object from saved data")
+            self._set_values(data)
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        if self._root:
+            with self._root.transaction():
+                yield
+            return
+
+        if self._transaction:
+            yield
+            return
+
+        if not self.path:
+            raise RuntimeError("'pattern' must be set to use a transaction")
+
+        mappers = (self, *self.parts)
+        for mapper in mappers:
+            if mapper.dirty:
+                mapper.save(_parts=False)
+            elif not self.manual and mapper.exists and mapper.modified:
+                mapper.load(_parts=False)
+
+        with hooks.disabled():
+            snapshots = [(m, copy.deepcopy(m._get_data())) for m in mappers]
+
+        log.debug(f"Starting transaction for '{self.classname}' object")
+        self._transaction = True
+        try:
+            with hooks.excluded(self):
+                yield
+        except BaseException:
+            log.info(f"Rolling back changes to '{self.classname}' object")
+            for mapper, snapshot in snapshots:
+                mapper._last_data = snapshot
+                mapper._set_values(snapshot)
+            raise
+        else:
+            self.save(_atomic=True)
+        finally:
+            self._transaction = False
+
+    def schedule(self) -> None:
+        if self._root:
+            self._root.schedule()
+            return
+
+        with hooks.disabled():
+            hooks.apply(self._instance, self)
+
+        writer.schedule(self)
+
+    def flush(self) -> None:
+        if self._root:
+            self._root.flush()
+            return
+
+        writer.flush(self)
+        for part in self.parts:
+            writer.flush(part)
+
 
 def create_mapper(obj, root=None) -> Mapper:
     try:
@@ -296,19 +685,94 @@ def create_mapper(obj, root=None) -> Mapper:
     pattern = meta.datafile_pattern
 
     if attrs is None and dataclasses.is_dataclass(obj):
-        attrs = {}
-        log.debug(f"Mapping attributes for {obj.__class__} object")
-        for field in [field for field in dataclasses.fields(obj) if field.init]:
-            self_name = f"self.{field.name}"
-            if pattern is None or self_name not in pattern:
-                attrs[field.name] = map_type(field.type, name=field.name)  # type: ignore
-
-    return Mapper(
-        obj,
-        attrs=attrs or {},
-        pattern=pattern,
-        manual=meta.datafile_manual,
-        defaults=meta.datafile_defaults,
-        infer=meta.datafile_infer,
-        root=root,
-    )
+        attrs = _get_attrs(obj.__class__, pattern)
+
+    options: Dict[str, Any] = {
+        "manual": meta.datafile_manual,
+        "defaults": meta.datafile_defaults,
+        "infer": meta.datafile_infer,
+        "readonly": meta.datafile_readonly,
+        "write_behind": meta.datafile_write_behind,
+        "stat_ttl": meta.datafile_stat_ttl,
+        "descriptors": meta.datafile_hooks == "descriptors",
+        "stamp": meta.datafile_stamp,
+        "lean": meta.datafile_lean,
+    }
+
+    if not (meta.datafile_groups and pattern and root is None):
+        return Mapper(obj, attrs=attrs or {}, pattern=pattern, root=root, **options)
+
+    groups = _get_groups(obj.__class__, pattern, attrs or {}, meta.datafile_groups)
+    mapper = Mapper(obj, attrs=groups[pattern], pattern=pattern, **options)
+    mapper._parts = {}  # pylint: disable=protected-access
+    for group_pattern, group_attrs in groups.items():
+        if group_pattern != pattern:
+            part = Mapper(
+                obj, attrs=group_attrs, pattern=group_pattern, main=mapper, **options
+            )
+            mapper._parts.update(dict.fromkeys(group_attrs, part))
+    return mapper
+
+
+_ATTRS: WeakKeyDictionary = WeakKeyDictionary()
+
+
+def _get_attrs(cls, pattern: Optional[str]) -> Dict:
+    """Map the fields of a dataclass to converters, shared by all instances."""
+    attrs_by_pattern = _ATTRS.setdefault(cls, {})
+    with suppress(KeyError):
+        return attrs_by_pattern[pattern]
+
+    attrs = {}
+    log.debug(f"Mapping attributes for {cls}")
+    for field in [field for field in dataclasses.fields(cls) if field.init]:
+        if pattern is None or field.name not in get_pattern(cls, pattern).placeholders:
+            attrs[field.name] = map_type(field.type, name=field.name)  # type: ignore
+
+    attrs_by_pattern[pattern] = attrs
+    return attrs
+
+
+_GROUPS: WeakKeyDictionary = WeakKeyDictionary()
+
+
+def _get_groups(
+    cls, pattern: str, attrs: Dict, groups: Mapping[str, Iterable[str]]
+) -> Dict[str, Dict]:
+    """Split mapped fields between the main file and each group's file."""
+    with suppress(KeyError):
+        return _GROUPS[cls]
+
+    base, extension = os.path.splitext(pattern)
+    if not extension or "}" in extension:
+        raise ValueError("'datafile_groups' requires an extension in the pattern")
+
+    split: Dict[str, Dict] = {pattern: dict(attrs)}
+    for group, names in groups.items():
+        group_attrs = split[f"{base}.{group}{extension}"] = {}
+        for name in names:
+            try:
+                group_attrs[name] = split[pattern].pop(name)
+            except KeyError:
+                raise ValueError(
+                    f"'datafile_groups' has an unknown or repeated field: '{name}'"
+                ) from None
+
+    _GROUPS[cls] = split
+    return split
+
+
+@cached
+def _get_schema(attrs: Tuple) -> str:
+    """Describe the converters of a model to detect files written differently."""
+    return ";".join(f"{name}={_describe(converter)}" for name, converter in attrs)
+
+
+def _describe(converter) -> str:
+    name = f"{converter.__module__}.{converter.__qualname__}"
+    if getattr(converter, "DATACLASS", None):
+        fields = _get_schema(tuple(converter.CONVERTERS.items()))
+        return f"{name}({fields})"
+    if getattr(converter, "CONVERTER", None):
+        return f"{name}[{_describe(converter.CONVERTER)}]"
+    return name
@@ -1,11 +1,14 @@
 import dataclasses
+from typing import Any, Optional, Set, get_args, get_origin
 
 import log
 from classproperties import classproperty
 
-from . import config, hooks, settings
+from . import config, hooks
 from .manager import Manager
 from .mapper import Mapper, create_mapper
+from .types import Ref
+from .utils import cached
 
 
 class Model:
@@ -19,7 +22,10 @@ class Model:
         # Using object.__setattr__ in case of frozen dataclasses
         object.__setattr__(self, "datafile", create_mapper(self))
 
-        if settings.HOOKS_ENABLED:
+        if self.datafile.readonly:
+            _check_frozen(self.__class__)  # type: ignore[arg-type]
+
+        if hooks.active():
             with hooks.disabled():
 
                 path = self.datafile.path
@@ -34,7 +40,7 @@ class Model:
                     elif path and create:
                         self.datafile.save()
 
-                    hooks.apply(self, self.datafile)
+                    hooks.apply(self, self.datafile, values=True)
 
         log.debug(f"Initialized {self.__class__} object")
 
@@ -44,14 +50,36 @@ class Model:
 
 
 def create_model(
-    cls, *, attrs=None, manual=None, pattern=None, defaults=None, infer=None
+    cls,
+    *,
+    attrs=None,
+    manual=None,
+    pattern=None,
+    defaults=None,
+    infer=None,
+    readonly=None,
 ):
     """Patch model attributes on to an existing dataclass."""
     log.debug(f"Converting {cls} to a datafile model")
 
-    if not dataclasses.is_dataclass(cls):
+    if not (isinstance(cls, type) and dataclasses.is_dataclass(cls)):
         raise ValueError(f"{cls} must be a dataclass")
 
+    # Add a slot for the mapper when instances have no '__dict__'
+
+    if not cls.__dictoffset__ and not hasattr(cls, "datafile"):
+        log.debug(f"Adding 'datafile' slot to {cls}")
+        cls = type(
+            cls.__name__,
+            (cls,),
+            {
+                "__slots__": ("datafile",),
+                "__module__": cls.__module__,
+                "__qualname__": cls.__qualname__,
+                "__doc__": cls.__doc__,
+            },
+        )
+
     # Patch meta
 
     meta = getattr(cls, "Meta", config.Meta())
@@ -67,9 +95,15 @@ def create_model(
         meta.datafile_defaults = defaults
     if not hasattr(cls, "Meta") and infer is not None:
         meta.datafile_infer = infer
+    if not hasattr(cls, "Meta") and readonly is not None:
+        meta.datafile_readonly = readonly
 
     cls.Meta = meta  # type: ignore
 
+    options = config.load(cls)
+    if options.datafile_readonly:
+        _check_frozen(cls)
+
     # Patch manager
 
     cls.objects = Manager(cls)  # type: ignore
@@ -86,4 +120,48 @@ def create_model(
     cls.__init__ = modified_init  # type: ignore
     cls.__init__.__doc__ = init.__doc__  # type: ignore
 
+    # Patch hooks
+
+    if meta.datafile_pattern and options.datafile_hooks == "methods":
+        if not options.datafile_readonly:
+            hooks.patch(cls)
+
     return cls
+
+
+@cached
+def _check_frozen(cls: type) -> None:
+    """Ensure shared read-only objects and their nested dataclasses are frozen."""
+    if not cls.__dataclass_params__.frozen:  # type: ignore[attr-defined]
+        raise ValueError(f"Read-only {cls} must be a frozen dataclass")
+
+    seen: Set[type] = {cls}
+    for field in dataclasses.fields(cls):
+        nested = _find_unfrozen(field.type, seen)
+        if nested:
+            raise ValueError(
+                f"Read-only {cls} must only contain frozen dataclasses: {nested}"
+            )
+
+
+def _find_unfrozen(annotation: Any, seen: Set[type]) -> Optional[type]:
+    if get_origin(annotation) is Ref:
+        return None  # referenced objects are loaded from their own files
+
+    if isinstance(annotation, type) and dataclasses.is_dataclass(annotation):
+        if annotation in seen:
+            return None
+        seen.add(annotation)
+        if not annotation.__dataclass_params__.frozen:  # type: ignore[attr-defined]
+            return annotation
+        for field in dataclasses.fields(annotation):
+            nested = _find_unfrozen(field.type, seen)
+            if nested:
+                return nested
+        return None
+
+    for arg in get_args(annotation):
+        nested = _find_unfrozen(arg, seen)
+        if nested:
+            return nested
+    return None
@@ -0,0 +1,154 @@
+"""Defines path patterns compiled once per model class."""
+
+from __future__ import annotations
+
+import dataclasses
+import inspect
+import os
+import re
+from contextlib import suppress
+from pathlib import Path
+from typing import Dict, FrozenSet, List, Optional, Tuple
+from weakref import WeakKeyDictionary
+
+import log
+import parse
+
+from .types import Missing
+
+PLACEHOLDER = re.compile(r"{self\.(\w+)((?:\.\w+)*)(![rsa])?(:[^{}]*)?}")
+
+
+class PathPattern:
+    """Model path pattern with its root, glob, and reverse parser precomputed."""
+
+    def __init__(self, cls: type, pattern: str):
+        self.cls = cls
+        self.pattern = pattern
+        self.placeholders: FrozenSet[str] = frozenset(
+            match.group(1) for match in PLACEHOLDER.finditer(pattern)
+        )
+
+        # Only the static directory ahead of the first placeholder is resolved
+        match = PLACEHOLDER.search(pattern)
+        first = match.start() if match else len(pattern)
+        self._cut = pattern.rfind("/", 0, first) + 1 if match else len(pattern)
+        if "{{" in pattern[: self._cut]:
+            self._cut = 0
+
+        self._cwd = pattern.startswith("./")
+        self._directory: Optional[str] = None
+        self._compiled: Optional[Tuple[str, List]] = None
+
+    def __repr__(self) -> str:
+        return f"<PathPattern: {self.pattern!r}>"
+
+    @property
+    def root(self) -> Path:
+        """Directory that relative patterns are joined to."""
+        if self._cwd:
+            return Path.cwd()
+        try:
+            return Path(inspect.getfile(self.cls)).parent
+        except (TypeError, OSError):
+            level = log.DEBUG if "__main__" in str(self.cls) else log.WARNING
+            log.log(level, f"Unable to determine module for {self.cls}")
+            return Path.cwd()
+
+    @property
+    def directory(self) -> str:
+        """Resolved directory containing the static part of the pattern."""
+        if self._cwd:
+            return str((Path.cwd() / self.pattern[: self._cut]).resolve())
+        if self._directory is None:
+            head = Path(self.pattern[: self._cut]).expanduser()
+            if head.is_absolute():
+                log.debug(f"Detected static path pattern: {self.pattern}")
+            else:
+                log.debug(f"Detected relative path pattern: {self.pattern}")
+                head = self.root / head
+            self._directory = str(head.resolve())
+        return self._directory
+
+    @property
+    def glob(self) -> str:
+        """Wildcard pattern matching all files of the model."""
+        splatted = PLACEHOLDER.sub("*", self._join(self.pattern[self._cut :]))
+        return splatted.replace(f"{os.sep}*{os.sep}", f"{os.sep}**{os.sep}")
+
+    def format(self, instance) -> Path:
+        """Build the path to an instance's file."""
+        text = self.pattern[self._cut :].format(self=instance)
+        if self._cut == 0 and text.startswith(("~", "/")):
+            return Path(text).expanduser().resolve()
+        return Path(self._join(text))
+
+    def parse(self, filename: str) -> Optional[List[str]]:
+        """Extract placeholder values from a matching filename."""
+        directory = self.directory
+        if self._compiled is None or self._compiled[0] != directory:
+            self._compiled = directory, self._compile()
+
+        for matcher in self._compiled[1]:
+            if isinstance(matcher, parse.Parser):
+                result = matcher.parse(filename)
+                values = list(result.named.values()) if result else None
+            else:
+                result = matcher.fullmatch(filename)
+                values = list(result.groups()) if result else None
+            if values is not None:
+                break
+        else:
+            return None
+
+        if len(values) > 1 and os.sep in values[-1]:
+            parts = values[-1].rsplit(os.sep, 1)
+            values[-2] = values[-2] + os.sep + parts[0]
+            values[-1] = parts[1]
+
+        return values
+
+    def _join(self, text: str) -> str:
+        return os.path.normpath(os.path.join(self.directory, text))
+
+    def _compile(self) -> List:
+        pattern = alt_pattern = self._join(self.pattern[self._cut :])
+        for field in dataclasses.fields(self.cls):
+            if not isinstance(field.default, Missing):
+                alt_pattern = alt_pattern.replace("{self." + field.name + "}", "")
+
+        matches = list(PLACEHOLDER.finditer(pattern))
+        if any(match.group(3) or match.group(4) for match in matches):
+            return [parse.compile(pattern), parse.compile(alt_pattern)]
+
+        return [_compile_regex(pattern), _compile_regex(alt_pattern)]
+
+
+def _compile_regex(pattern: str):
+    expression = []
+    groups: Dict[str, int] = {}
+    index = 0
+    for match in PLACEHOLDER.finditer(pattern):
+        expression.append(re.escape(pattern[index : match.start()]))
+        name = match.group(0)
+        if name in groups:
+            expression.append(f"(?P=g{groups[name]})")
+        else:
+            groups[name] = len(groups)
+            expression.append(f"(?P<g{groups[name]}>.+?)")
+        index = match.end()
+    expression.append(re.escape(pattern[index:]))
+    return re.compile("".join(expression), re.IGNORECASE | re.DOTALL)
+
+
+_PATTERNS: WeakKeyDictionary = WeakKeyDictionary()
+
+
+def get_pattern(cls: type, pattern: str) -> PathPattern:
+    """Get the compiled path pattern shared by all instances of a class."""
+    patterns = _PATTERNS.setdefault(cls, {})
+    with suppress(KeyError):
+        return patterns[pattern]
+
+    patterns[pattern] = PathPattern(cls, pattern)
+    return patterns[pattern]
@@ -0,0 +1,121 @@
+"""Defines a unit of work to save many changed objects together."""
+
+# pylint: disable=protected-access
+
+from __future__ import annotations
+
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from threading import Lock
+from typing import TYPE_CHECKING, Dict, List, Tuple
+
+import log
+
+from . import hooks
+from .utils import sync_directory, write
+from .writer import writer
+
+if TYPE_CHECKING:
+    from .mapper import Mapper
+
+
+class Session:
+    """Collect automatic saves and write them in one pass per directory."""
+
+    def __init__(self, *, workers: int = 1):
+        self.workers = workers
+        self.written = 0
+        self.skipped = 0
+        self.bytes_written = 0
+        self._mappers: Dict[int, Mapper] = {}
+        self._tokens: List = []
+        self._lock = Lock()
+
+    def __repr__(self) -> str:
+        return (
+            f"<Session: {len(self._mappers)} pending, {self.written} written, "
+            f"{self.skipped} skipped, {self.bytes_written} bytes>"
+        )
+
+    def __enter__(self) -> Session:
+        self._tokens.append(hooks.SESSION.set(self))
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        hooks.SESSION.reset(self._tokens.pop())
+        if exc_type is None:
+            self.flush()
+        else:
+            self.clear()
+
+    def add(self, *objects) -> None:
+        """Track objects to be saved when the session is flushed."""
+        for obj in objects:
+            self.track(obj.datafile)
+            for part in obj.datafile.parts:
+                self.track(part)
+
+    def track(self, mapper: Mapper) -> None:
+        root = mapper.root
+        root._dirty = True
+        self._mappers[id(root)] = root
+
+        # Grouped fields still read from the main file must be saved with it
+        for part in root.parts:
+            if not part.exists:
+                part._dirty = True
+                self._mappers[id(part)] = part
+
+    def clear(self) -> None:
+        """Forget all tracked objects without saving them."""
+        mappers = list(self._mappers.values())
+        self._mappers.clear()
+        if mappers:
+            log.info(f"Discarding {len(mappers)} unsaved object(s) in session")
+        for mapper in mappers:
+            writer.release(mapper)
+
+    def flush(self) -> None:
+        """Save all tracked objects that have changed."""
+        mappers = list(self._mappers.values())
+        self._mappers.clear()
+        if not mappers:
+            return
+
+        log.info(f"Flushing {len(mappers)} object(s) in session")
+
+        # Unsaved objects are released too, so file changes are loaded again
+        try:
+            groups: Dict[Path, List[Tuple[Mapper, Tuple]]] = defaultdict(list)
+            for mapper in mappers:
+                rendered = mapper._render()
+                if rendered:
+                    groups[mapper.path.parent].append((mapper, rendered))  # type: ignore
+                else:
+                    self.skipped += 1
+
+            if self.workers > 1 and len(groups) > 1:
+                with ThreadPoolExecutor(self.workers) as executor:
+                    list(executor.map(self._write, groups.values()))
+            else:
+                for items in groups.values():
+                    self._write(items)
+        finally:
+            for mapper in mappers:
+                writer.release(mapper)
+
+    def _write(self, items: List[Tuple[Mapper, Tuple]]) -> None:
+        directory = None
+        for mapper, (data, text, digest) in items:
+            path = mapper.path
+            assert path, "Rendered objects always have a path"
+            write(path, text, display=True, atomic=True, sync=True)
+            mapper._written(data, digest, reload=True)
+            with self._lock:
+                self.written += 1
+                self.bytes_written += len(text.encode())
+            directory = path.parent
+
+        if directory:
+            sync_directory(directory)
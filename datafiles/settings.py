@@ -7,3 +7,13 @@ HOOKS_ENABLED = True
 MINIMAL_DIFFS = True
 
 WRITE_DELAY = 0.0  # seconds
+
+WRITE_BEHIND = False
+
+WRITE_BEHIND_DELAY = 0.1  # seconds without changes before saving
+
+WRITE_BEHIND_LATENCY = 1.0  # seconds before saving during continuous changes
+
+WRITE_BEHIND_LIMIT = 1000  # pending objects before saving synchronously
+
+WRITE_BEHIND_BACKOFF = 60.0  # maximum seconds between retries of failed saves
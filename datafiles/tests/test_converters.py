@@ -2,12 +2,12 @@
 
 from dataclasses import dataclass
 from enum import Enum
-from typing import ByteString, Dict, List, Mapping, Optional, Set, TypedDict, Union
+from typing import Any, ByteString, Dict, List, Mapping, Optional, Set, TypedDict, Union
 
 import pytest
 from ruamel.yaml.scalarstring import LiteralScalarString
 
-from datafiles import converters, settings
+from datafiles import Ref, converters, datafile, settings
 
 from . import xfail_without_pep_604, xfail_without_type_names
 
@@ -423,6 +423,98 @@ def describe_converter():
             expect(data) == []
 
 
+def describe_dictionary():
+    def it_copies_nested_values(expect):
+        value: Dict[str, Any] = {"items": [1, 2], "item": MyDataclass(foobar=1)}
+
+        data = MyDict.to_preserialization_data(value)
+        value["items"].append(3)
+
+        expect(data) == {"items": [1, 2], "item": {"foobar": 1, "flag": False}}
+
+
+def describe_dataclass():
+    def it_builds_a_plan_once_per_converter(expect):
+        plan = MyDataclassConverter.get_plan()
+
+        expect([name for name, *_ in plan]) == ["foobar", "flag"]
+        expect(MyDataclassConverter.get_plan()).is_(plan)
+
+    def it_ignores_unmapped_attributes(expect):
+        value = MyDataclassConverter.to_python_value({"foobar": 1, "extra": 2})
+
+        expect(value) == MyDataclass(foobar=1)
+
+
+def describe_get_loader():
+    def it_builds_a_loader_once_per_converter(expect):
+        loader = IntegerList.get_loader()
+
+        expect(IntegerList.get_loader()).is_(loader)
+
+    def it_returns_matching_literals_unchanged(expect):
+        expect(converters.String.get_loader()("foo")) == "foo"
+        expect(converters.Integer.get_loader()(42)) == 42
+
+    def it_converts_mismatched_literals(expect):
+        expect(converters.Integer.get_loader()("42")) == 42
+        expect(converters.Boolean.get_loader()("no")).is_(False)
+
+    def it_converts_custom_literals(expect):
+        class Upper(converters.String):
+            @classmethod
+            def to_python_value(cls, deserialized_data, *, target_object=None):
+                return deserialized_data.upper()
+
+        expect(Upper.get_loader()("foo")) == "FOO"
+
+    def it_builds_nested_values(expect):
+        load = MyDataclassConverterList.get_loader()
+
+        value = load([{"foobar": 1}, {"foobar": 2, "flag": True}])
+
+        expect(value) == [MyDataclass(foobar=1), MyDataclass(foobar=2, flag=True)]
+
+    def it_falls_back_to_conversion_for_missing_values(expect):
+        load = MyDataclassConverter.get_loader()
+
+        expect(load({"flag": True})) == MyDataclass(foobar=0, flag=True)
+        expect(IntegerList.get_loader()([None])) == []
+
+
+def describe_reference():
+    @pytest.fixture
+    def converter():
+        @datafile("../tmp/users/{self.key}.yml", manual=True)
+        class User:
+            key: str
+            name: str = ""
+
+        return converters.map_type(Ref[User])
+
+    def it_stores_placeholder_values(expect, converter):
+        user = converter.MODEL("alice")
+
+        expect(converter.to_preserialization_data(user)) == "alice"
+        expect(converter.to_preserialization_data(None)).is_(None)
+
+    def it_creates_unresolved_references(expect, converter):
+        value = converter.to_python_value("alice")
+
+        expect(value) == Ref(converter.MODEL, (("key", "alice"),))
+        expect(value) == converter.MODEL("alice")
+        expect(value._object).is_(None)
+
+    def it_keeps_matching_objects(expect, converter):
+        user = converter.MODEL("alice")
+
+        expect(converter.to_python_value("alice", target_object=user)).is_(user)
+
+    def it_requires_a_model_class(expect):
+        with expect.raises(TypeError, "Model class is required with 'Ref' annotation"):
+            converters.map_type(Ref["User"])  # type: ignore[name-defined]
+
+
 def describe_register():
     def with_new_type(expect):
         converters.register(MyCustomString, converters.String)
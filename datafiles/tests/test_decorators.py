@@ -39,6 +39,15 @@ def describe_datafile():
 
         expect(is_dataclass(cls)).is_(True)
 
+    def it_freezes_readonly_models(expect):
+        class Sample:
+            pass
+
+        cls = decorators.datafile("<pattern>", readonly=True)(Sample)
+
+        expect(cls.__dataclass_params__.frozen).is_(True)  # type: ignore
+        expect(cls.__dict__.get("_patched")).is_(None)
+
 
 def describe_sync():
     def it_turns_dataclass_instance_into_model_instance(expect):
@@ -1,6 +1,8 @@
 # pylint: disable=unused-variable
 
 
+from io import StringIO
+
 import pytest
 
 from datafiles import formats
@@ -37,6 +39,77 @@ def describe_serialize():
             """)
 
 
+def describe_serialize_changes():
+    def describe_yaml():
+        @pytest.fixture
+        def text():
+            return dedent("""
+            # Header
+            key: value  # Inline
+            items:
+              - 1
+              - 2
+            """)
+
+        def it_matches_full_serialization(expect, text):
+            cache = formats.Cache(text)
+            data = formats.YAML.deserialize(StringIO(text))
+            data["key"] = "changed"
+
+            changed = formats.serialize(data, ".yml", cache=cache)
+            expect(changed) == formats.serialize(data, ".yml")
+
+        def it_reuses_text_for_unchanged_entries(expect, text, mocker):
+            cache = formats.Cache(text)
+            data = formats.YAML.deserialize(StringIO(text))
+            formats.serialize(data, ".yml", cache=cache)
+
+            serialize = mocker.spy(formats.YAML, "serialize")
+            data["key"] = "changed"
+            formats.serialize(data, ".yml", cache=cache)
+
+            expect(serialize.call_count) == 1
+            expect(serialize.call_args.args[0]) == {"key": "changed"}
+
+        def it_keeps_anchors_and_aliases(expect):
+            text = dedent("""
+            base: &base
+              x: 1
+            copy: *base
+            key: value
+            """)
+            cache = formats.Cache(text)
+            data = formats.YAML.deserialize(StringIO(text))
+            data["key"] = "changed"
+
+            changed = formats.serialize(data, ".yml", cache=cache)
+            expect(changed) == formats.serialize(data, ".yml")
+            expect(changed).contains("copy: *base")
+
+    def describe_toml():
+        def it_preserves_comments(expect):
+            text = dedent("""
+            # Header
+            key = "value"  # Inline
+
+            [nested]
+            # Nested
+            count = 1
+            """)
+            cache = formats.Cache(text)
+            data = formats.TOML.deserialize(StringIO(text))
+            data["nested"]["count"] = 2
+
+            expect(formats.serialize(data, ".toml", cache=cache)) == dedent("""
+            # Header
+            key = "value"  # Inline
+
+            [nested]
+            # Nested
+            count = 2
+            """)
+
+
 def describe_deserialize():
     @pytest.fixture
     def path(tmp_path):
@@ -69,3 +142,105 @@ def describe_deserialize():
     def with_unknown_extension(expect, path):
         with expect.raises(ValueError):
             formats.deserialize(path, ".xyz")
+
+
+def describe_deserialize_plain():
+    def it_returns_builtin_types_for_yaml(expect):
+        text = "# Comment\nitems:\n  - name: foo\n    score: 1.5\n"
+
+        data = formats.YAML.deserialize_plain(StringIO(text))
+
+        expect(data) == {"items": [{"name": "foo", "score": 1.5}]}
+        expect(type(data)) == dict
+        expect(type(data["items"][0]["score"])) == float
+
+    def it_applies_to_partial_loads(expect):
+        text = "name: foo\nstatus: done\n"
+
+        data = formats.YAML.deserialize_keys(StringIO(text), {"name"}, plain=True)
+
+        expect(type(data)) == dict
+
+
+def describe_deserialize_keys():
+    def describe_yaml():
+        @pytest.fixture
+        def text():
+            return dedent("""
+            name: foo  # Inline
+            history:
+              - 1
+              - 2
+            status: &status done
+            copy: *status
+            """)
+
+        def it_loads_only_the_requested_keys(expect, text):
+            data = formats.YAML.deserialize_keys(StringIO(text), {"name", "status"})
+            expect(data) == {"name": "foo", "status": "done"}
+
+        def it_stops_parsing_after_the_requested_keys(expect, text):
+            text += "invalid: [\n"
+            data = formats.YAML.deserialize_keys(StringIO(text), {"name"})
+            expect(data) == {"name": "foo"}
+
+        def it_falls_back_to_a_full_load_for_aliases(expect, text):
+            data = formats.YAML.deserialize_keys(StringIO(text), {"copy"})
+            expect(data) == {"copy": "done"}
+
+        def it_falls_back_to_a_full_load_for_flow_style(expect):
+            text = "{name: foo, status: done}"
+            data = formats.YAML.deserialize_keys(StringIO(text), {"status"})
+            expect(data) == {"status": "done"}
+
+    def describe_json():
+        def it_loads_only_the_requested_keys(expect):
+            text = '{"name": "foo", "history": [1, "}"], "status": "done"}'
+            data = formats.JSON.deserialize_keys(StringIO(text), {"status"})
+            expect(data) == {"status": "done"}
+
+        def it_stops_parsing_after_the_requested_keys(expect):
+            text = '{"name": "foo", "history": ['
+            data = formats.JSON.deserialize_keys(StringIO(text), {"name"})
+            expect(data) == {"name": "foo"}
+
+    def describe_toml():
+        def it_loads_only_the_requested_keys(expect):
+            text = "name = 'foo'\nstatus = 'done'\n"
+            data = formats.TOML.deserialize_keys(StringIO(text), {"name"})
+            expect(data) == {"name": "foo"}
+
+
+def describe_stamp():
+    def it_appends_a_comment(expect):
+        text = formats.stamp("name: foo", ".yml", "schema")
+
+        expect(text.startswith("name: foo\n# datafiles:")).is_(True)
+        expect(formats.unstamp(text, ".yml", "schema")) == ("name: foo\n", True)
+
+    def it_uses_the_formats_comment_syntax(expect):
+        text = formats.stamp("{}\n", ".json5", "schema")
+
+        expect(text.splitlines()[-1].startswith("// datafiles:")).is_(True)
+
+    def it_skips_formats_without_comments(expect):
+        expect(formats.stamp("{}", ".json", "schema")) == "{}"
+
+
+def describe_unstamp():
+    @pytest.fixture
+    def text():
+        return formats.stamp("name: foo\n", ".toml", "schema")
+
+    def it_detects_changed_schemas(expect, text):
+        expect(formats.unstamp(text, ".toml", "other")) == ("name: foo\n", False)
+
+    def it_detects_changed_text(expect, text):
+        text = text.replace("foo", "bar")
+
+        expect(formats.unstamp(text, ".toml", "schema")) == ("name: bar\n", False)
+
+    def it_ignores_unstamped_text(expect):
+        text = "name: foo\n# datafiles: in a comment\nstatus: done\n"
+
+        expect(formats.unstamp(text, ".yml", "schema")) == (text, False)
@@ -1,9 +1,10 @@
 # pylint: disable=unused-variable,unsubscriptable-object
 
+from threading import Thread
 from typing import List
 
 import datafiles
-from datafiles import datafile, field, hooks, settings
+from datafiles import datafile, field, hooks, settings, types
 
 
 @datafile
@@ -17,6 +18,29 @@ class Sample:
     items: List[Item] = field(default_factory=list)
 
 
+def describe_patch():
+    def it_patches_models_when_decorated(expect):
+        @datafile("../tmp/sample.yml", manual=True)
+        class Model:
+            key: int = 1
+
+        expect(Model.__dict__.get("_patched")).is_(True)
+        expect(hasattr(Model.__setattr__, "_patched")).is_(True)
+
+    def it_only_patches_classes_once(expect, mocker):
+        class Custom:
+            pass
+
+        hooks.patch(Custom)
+        method = Custom.__setattr__
+        spy = mocker.spy(hooks, "save_after")
+
+        hooks.patch(Custom)
+
+        expect(Custom.__setattr__).is_(method)
+        expect(spy.called).is_(False)
+
+
 def describe_apply():
     def it_can_be_called_twice(expect, mocker):
         instance = Sample()
@@ -30,30 +54,81 @@ def describe_apply():
 
     def it_patches_list_elements(expect, mocker):
         instance = Sample(items=[Item("a"), Item("b")])
-        setattr(instance, "datafile", mocker.MagicMock(attrs=["key", "items"]))
+        mapper = mocker.MagicMock(attrs=["key", "items"])
+        mapper.part.return_value = mapper
+        mapper.root.root = mapper.root
+        mapper.root.descriptors = False
+        setattr(instance, "datafile", mapper)
 
         hooks.apply(instance, None)
         expect(hasattr(instance.items[0].__setattr__, "_patched")).is_(True)
 
+    def it_binds_nested_values_on_first_access(expect, mocker):
+        instance = Sample(items=[Item("a"), Item("b")])
+        mapper = mocker.MagicMock(attrs=["key", "items"])
+        mapper.part.return_value = mapper
+        mapper.root.root = mapper.root
+        mapper.root.descriptors = False
+        setattr(instance, "datafile", mapper)
+
+        hooks.apply(instance, None)
+        expect(type(instance.__dict__["items"])) == list
+
+        items = instance.items
+        expect(type(items)) == types.List
+        expect(items.datafile) == mapper.root  # type: ignore
+        expect(id(instance.items)) == id(items)
+
+        first, second = list(items)
+        expect(first.datafile.root) == mapper.root
+        expect(second.datafile.root) == mapper.root
+
 
 def describe_disabled():
     def when_nested(expect):
-        expect(settings.HOOKS_ENABLED).is_(True)
+        expect(hooks.active()).is_(True)
 
         with hooks.disabled():
-            expect(settings.HOOKS_ENABLED).is_(False)
+            expect(hooks.active()).is_(False)
 
             with hooks.disabled():
-                expect(settings.HOOKS_ENABLED).is_(False)
+                expect(hooks.active()).is_(False)
 
-            expect(settings.HOOKS_ENABLED).is_(False)
+            expect(hooks.active()).is_(False)
 
-        expect(settings.HOOKS_ENABLED).is_(True)
+        expect(hooks.active()).is_(True)
 
     def with_alias(expect):
-        expect(settings.HOOKS_ENABLED).is_(True)
+        expect(hooks.active()).is_(True)
 
         with datafiles.frozen():
-            expect(settings.HOOKS_ENABLED).is_(False)
+            expect(hooks.active()).is_(False)
+
+        expect(hooks.active()).is_(True)
+
+    def with_global_setting(expect, monkeypatch):
+        monkeypatch.setattr(settings, "HOOKS_ENABLED", False)
+
+        expect(hooks.active()).is_(False)
+
+    def without_affecting_other_threads(expect):
+        results = []
+
+        with hooks.disabled():
+            thread = Thread(target=lambda: results.append(hooks.active()))
+            thread.start()
+            thread.join()
+
+        expect(results) == [True]
+
+    def with_only_objects(expect, mocker):
+        instance = mocker.Mock(datafile=mocker.Mock(manual=False, parts=()))
+        other = mocker.Mock(datafile=mocker.Mock(manual=False, parts=()))
+
+        with hooks.disabled(instance, only=True):
+            expect(hooks.active()).is_(True)
+            expect(hooks.enabled(instance.datafile, ())).is_(False)
+            expect(hooks.enabled(other.datafile, ())).is_(True)
 
-        expect(settings.HOOKS_ENABLED).is_(True)
+        expect(hooks.enabled(instance.datafile, ())).is_(True)
+        expect(instance.datafile.save.called).is_(True)
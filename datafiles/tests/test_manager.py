@@ -4,7 +4,7 @@ import shutil
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
-from unittest.mock import patch
+from unittest.mock import PropertyMock, patch
 
 import pytest
 
@@ -57,7 +57,7 @@ def describe_manager():
     def describe_get():
         @patch("datafiles.mapper.Mapper.load")
         @patch("datafiles.mapper.Mapper.exists", True)
-        @patch("datafiles.mapper.Mapper.modified", False)
+        @patch("datafiles.mapper.Mapper.modified", PropertyMock(return_value=False))
         def when_absent_pattern_arg(mock_load, expect, manager):
             instance = manager.get(1)
             expect(instance.foo) == 1
@@ -72,7 +72,7 @@ def describe_manager():
 
         @patch("datafiles.mapper.Mapper.load")
         @patch("datafiles.mapper.Mapper.exists", True)
-        @patch("datafiles.mapper.Mapper.modified", False)
+        @patch("datafiles.mapper.Mapper.modified", PropertyMock(return_value=False))
         def when_absent_pattern_arg_has_default_value(
             mock_load, expect, manager_with_defaults: Manager
         ):
@@ -81,19 +81,65 @@ def describe_manager():
             expect(mock_load.called).is_(True)
 
         @patch("datafiles.mapper.Mapper.exists", True)
-        @patch("datafiles.mapper.Mapper.modified", False)
+        @patch("datafiles.mapper.Mapper.modified", PropertyMock(return_value=False))
         def when_partial_args_match_file(expect, manager_with_files: Manager):
             expect(manager_with_files.get(1)) == MyClass(foo=1, bar=2)
 
         @patch("datafiles.mapper.Mapper.exists", True)
-        @patch("datafiles.mapper.Mapper.modified", False)
+        @patch("datafiles.mapper.Mapper.modified", PropertyMock(return_value=False))
         def when_partial_kwargs_match_file(expect, manager_with_files: Manager):
             expect(manager_with_files.get(foo=1)) == MyClass(foo=1, bar=2)
 
+    def describe_lazy():
+        def it_defers_loading_until_a_field_is_accessed(
+            expect, manager_with_files: Manager
+        ):
+            instance = manager_with_files.lazy().get(1)
+            expect(instance.datafile.deferred) == {"bar", "nested"}
+            expect(instance.foo) == 1  # type: ignore[attr-defined]
+            expect(instance.datafile.deferred) == {"bar", "nested"}
+
+            expect(instance.bar) == 2  # type: ignore[attr-defined]
+            expect(instance.datafile.deferred) == set()
+
+        def it_leaves_the_original_manager_unchanged(
+            expect, manager_with_files: Manager
+        ):
+            manager_with_files.lazy()
+            expect(manager_with_files.get(1).datafile.deferred) == set()
+
+        @patch("datafiles.mapper.Mapper.exists", False)
+        def when_file_missing(expect, manager: Manager):
+            expect(manager.lazy().get_or_none(foo=3)).is_(None)
+
+    def describe_only():
+        def it_defers_other_fields(expect, manager_with_files: Manager):
+            instance = manager_with_files.only("bar").get(1)
+            expect(instance.datafile.deferred) == {"nested"}
+            expect(instance.bar) == 2  # type: ignore[attr-defined]
+
+        def it_rejects_unknown_fields(expect, manager: Manager):
+            with expect.raises(TypeError, "Manager.only() got an unknown field: 'baz'"):
+                manager.only("baz")
+
+    def describe_defer():
+        def it_defers_the_given_fields(expect, manager_with_files: Manager):
+            instance = manager_with_files.defer("bar").get(1)
+            expect(instance.datafile.deferred) == {"bar"}
+            expect(instance.bar) == 2  # type: ignore[attr-defined]
+            expect(instance.datafile.deferred) == set()
+
+    def describe_prefetch():
+        def it_rejects_unknown_fields(expect, manager: Manager):
+            with expect.raises(
+                TypeError, "Manager.prefetch() got an unknown field: 'baz'"
+            ):
+                manager.prefetch("baz")
+
     def describe_get_or_none():
         @patch("datafiles.mapper.Mapper.load")
         @patch("datafiles.mapper.Mapper.exists", True)
-        @patch("datafiles.mapper.Mapper.modified", False)
+        @patch("datafiles.mapper.Mapper.modified", PropertyMock(return_value=False))
         def when_file_exists(mock_load, expect, manager: Manager):
             expect(manager.get_or_none(foo=1, bar=2)) == MyClass(foo=1, bar=2)
             expect(mock_load.called).is_(True)
@@ -104,16 +150,16 @@ def describe_manager():
 
         def when_file_corrupt(expect, manager: Manager):
             instance = manager.get_or_create(foo=2, bar=1)
-            instance.datafile.path.write_text("{")
+            instance.datafile.path.write_text("{")  # type: ignore[union-attr]
             instance2 = manager.get_or_none(foo=2, bar=2)
             expect(instance2).is_(None)
-            expect(instance.datafile.path.is_file()).is_(False)
+            expect(instance.datafile.path.is_file()).is_(False)  # type: ignore[union-attr]
 
     def describe_get_or_create():
         @patch("datafiles.mapper.Mapper.save")
         @patch("datafiles.mapper.Mapper.load")
         @patch("datafiles.mapper.Mapper.exists", True)
-        @patch("datafiles.mapper.Mapper.modified", False)
+        @patch("datafiles.mapper.Mapper.modified", PropertyMock(return_value=False))
         def when_file_exists(mock_save, mock_load, expect, manager: Manager):
             expect(manager.get_or_create(foo=1, bar=2)) == MyClass(foo=1, bar=2)
             expect(mock_save.called).is_(True)
@@ -129,7 +175,7 @@ def describe_manager():
 
         def when_file_corrupt(expect, manager: Manager):
             instance = manager.get_or_create(foo=2, bar=1)
-            instance.datafile.path.write_text("{")
+            instance.datafile.path.write_text("{")  # type: ignore[union-attr]
             instance2 = manager.get_or_create(foo=2, bar=2)
             expect(instance2.bar) == 2  # type: ignore[attr-defined]
 
@@ -1,5 +1,6 @@
-# pylint: disable=unused-variable
+# pylint: disable=unused-variable,unused-argument
 
+import os
 import platform
 from dataclasses import dataclass
 from pathlib import Path
@@ -8,6 +9,7 @@ import pytest
 
 from datafiles.config import Meta
 from datafiles.mapper import Mapper, create_mapper
+from datafiles.utils import write as write_file
 
 
 @dataclass
@@ -16,6 +18,10 @@ class MyClass:
 
 
 class MyField:
+    @classmethod
+    def to_python_value(cls, deserialized_data, *, target_object):
+        return deserialized_data
+
     @classmethod
     def to_preserialization_data(cls, python_value):
         return python_value
@@ -98,18 +104,188 @@ def describe_mapper():
             with expect.raises(ValueError):
                 print(mapper.text)
 
+    def describe_data():
+        def it_reads_values_without_copying_the_object(expect, mapper, mocker):
+            mapper.attrs = {"foobar": MyField}
+            asdict = mocker.patch("dataclasses.asdict")
+
+            expect(mapper.data) == {"foobar": 42}
+            expect(asdict.called).is_(False)
+
+        def it_uses_updated_attributes(expect, mapper):
+            expect(mapper.data) == {}
+
+            mapper.attrs = {"foobar": MyField}
+
+            expect(mapper.data) == {"foobar": 42}
+
     def describe_load():
         def it_requires_path(expect, mapper):
             with expect.raises(RuntimeError):
                 mapper.load()
 
+        def it_only_converts_changed_values_when_diffing(expect, mapper, mocker):
+            mapper._pattern = "../../tmp/sample.yml"
+            mapper.attrs = {"foobar": MyField}
+            mapper.save()
+            convert = mocker.spy(MyField, "to_python_value")
+
+            write_file(mapper.path, "foobar: 42\n")
+            mapper.load(_diff=True)
+            expect(convert.called).is_(False)
+
+            write_file(mapper.path, "foobar: 24\n")
+            mapper.load(_diff=True)
+            expect(convert.call_count) == 1
+            expect(mapper._instance.foobar) == 24
+
     def describe_save():
         def it_requires_path(expect, mapper):
             with expect.raises(RuntimeError):
                 mapper.save()
 
+        def it_skips_unchanged_text(expect, mapper, mocker):
+            mapper._pattern = "../../tmp/sample.yml"
+            mapper.attrs = {"foobar": MyField}
+            write = mocker.patch("datafiles.mapper.write", wraps=write_file)
+
+            mapper.save()
+            mapper.save()
+
+            expect(write.call_count) == 1
+            expect(mapper.saves_skipped) == 1
+
+        def it_skips_unchanged_text_after_loading(expect, mapper, mocker):
+            mapper._pattern = "../../tmp/sample.yml"
+            mapper.attrs = {"foobar": MyField}
+            write_file(mapper.path, "foobar: 42\n")
+            mapper._instance.datafile = mapper
+            write = mocker.patch("datafiles.mapper.write")
+
+            mapper.load()
+            mapper.save()
+
+            expect(write.called).is_(False)
+            expect(mapper.saves_skipped) == 1
+
+        def it_saves_unchanged_text_after_file_changes(expect, mapper, mocker):
+            mapper._pattern = "../../tmp/sample.yml"
+            mapper.attrs = {"foobar": MyField}
+            mapper.save()
+            write_file(mapper.path, "foobar: 0\n")
+            write = mocker.patch("datafiles.mapper.write")
+
+            mapper.save()
+
+            expect(write.called).is_(True)
+            expect(mapper.saves_skipped) == 0
+
+    def describe_modified():
+        @pytest.fixture
+        def saved(mapper):
+            mapper._pattern = "../../tmp/sample.yml"
+            mapper.attrs = {"foobar": MyField}
+            mapper.save()
+            return mapper
+
+        def is_false_after_saving(expect, saved):
+            expect(saved.modified).is_(False)
+
+        def it_detects_changes_within_the_same_tick(expect, saved):
+            key = os.stat(saved.path)
+            saved.path.write_text("foobar: 24\n")
+            os.utime(saved.path, ns=(key.st_atime_ns, key.st_mtime_ns))
+
+            expect(saved.modified).is_(True)
+
+        def it_detects_replaced_files(expect, saved):
+            text = saved.path.read_text()
+            saved.path.unlink()
+            saved.path.write_text(text + "\n")
+
+            expect(saved.modified).is_(True)
+
+        def it_skips_reading_old_files(expect, saved, mocker):
+            saved._last_check += 60 * 1_000_000_000
+            read_text = mocker.spy(Path, "read_text")
+
+            expect(saved.modified).is_(False)
+            expect(read_text.called).is_(False)
+
 
 def describe_create_mapper():
+    def it_shares_attrs_between_instances(expect):
+        @dataclass
+        class MyModel:
+            foobar: int
+
+        first = create_mapper(MyModel(1))
+        second = create_mapper(MyModel(2))
+
+        expect(first.attrs).is_(second.attrs)
+
+    def it_copies_shared_attrs_before_inferring(expect):
+        @dataclass
+        class MyModel:
+            foobar: int
+
+        first = create_mapper(MyModel(1))
+        second = create_mapper(MyModel(2))
+        first._infer = True
+
+        first._set_values({"foobar": 1, "extra": 2})
+
+        expect(list(first.attrs)) == ["foobar", "extra"]
+        expect(list(second.attrs)) == ["foobar"]
+
+    def it_splits_grouped_fields_into_parts(expect):
+        @dataclass
+        class MyModel:
+            key: int
+            count: int = 0
+            history: str = ""
+
+            class Meta:
+                datafile_pattern = "../tmp/{self.key}.yml"
+                datafile_groups = {"history": ["history"]}
+
+        mapper = create_mapper(MyModel(1))
+
+        expect(list(mapper.attrs)) == ["count"]
+        expect(len(mapper.parts)) == 1
+        expect(mapper.part("history").path.name) == "1.history.yml"  # type: ignore
+        expect(mapper.part("count")).is_(mapper)
+        expect(create_mapper(MyModel(2)).part("history").attrs).is_(
+            mapper.part("history").attrs
+        )
+
+    def it_rejects_unknown_grouped_fields(expect):
+        @dataclass
+        class MyModel:
+            count: int = 0
+
+            class Meta:
+                datafile_pattern = "../tmp/sample.yml"
+                datafile_groups = {"history": ["history"]}
+
+        message = "'datafile_groups' has an unknown or repeated field: 'history'"
+        with expect.raises(ValueError, message):
+            create_mapper(MyModel())
+
+    def it_requires_an_extension_for_grouped_fields(expect):
+        @dataclass
+        class MyModel:
+            key: int
+            count: int = 0
+
+            class Meta:
+                datafile_pattern = "../tmp/{self.key}"
+                datafile_groups = {"counts": ["count"]}
+
+        message = "'datafile_groups' requires an extension in the pattern"
+        with expect.raises(ValueError, message):
+            create_mapper(MyModel(1))
+
     def it_reuses_existing_datafile(mocker, expect):
         obj = mocker.Mock()
         mapper = mocker.Mock()
@@ -0,0 +1,80 @@
+# pylint: disable=unused-variable
+
+from dataclasses import dataclass
+from pathlib import Path
+
+import pytest
+
+from datafiles.pattern import PathPattern, get_pattern
+
+
+@dataclass
+class MyClass:
+    key: str
+    name: str = "default"
+    count: int = 0
+
+
+def describe_path_pattern():
+    @pytest.fixture
+    def pattern():
+        return PathPattern(MyClass, "../tmp/{self.key}/{self.name}.yml")
+
+    @pytest.fixture
+    def root():
+        return Path(__file__).parent.parent / "tmp"
+
+    def it_finds_placeholder_fields(expect, pattern):
+        expect(pattern.placeholders) == {"key", "name"}
+
+    def it_finds_nested_placeholder_fields(expect):
+        pattern = PathPattern(MyClass, "{self.key.upper}.yml")
+        expect(pattern.placeholders) == {"key"}
+
+    def describe_format():
+        def it_resolves_relative_to_the_module(expect, pattern, root):
+            path = pattern.format(MyClass("a", "b"))
+            expect(path) == root / "a" / "b.yml"
+
+        def it_resolves_relative_to_the_current_directory(
+            expect, tmp_path, monkeypatch
+        ):
+            monkeypatch.chdir(tmp_path)
+            pattern = PathPattern(MyClass, "./{self.key}.json")
+            expect(pattern.format(MyClass("a"))) == tmp_path.resolve() / "a.json"
+
+        def it_handles_absolute_placeholder_values(expect, tmp_path):
+            pattern = PathPattern(MyClass, "{self.key}/data.yml")
+            path = pattern.format(MyClass(str(tmp_path)))
+            expect(path) == tmp_path.resolve() / "data.yml"
+
+    def describe_glob():
+        def it_replaces_placeholders(expect, pattern, root):
+            expect(pattern.glob) == str(root / "**" / "*.yml")
+
+    def describe_parse():
+        def it_extracts_placeholder_values(expect, pattern, root):
+            values = pattern.parse(str(root / "a" / "b.yml"))
+            expect(values) == ["a", "b"]
+
+        def it_assigns_nested_directories_to_earlier_values(expect, pattern, root):
+            values = pattern.parse(str(root / "a" / "b" / "c.yml"))
+            expect(values) == ["a/b", "c"]
+
+        def it_falls_back_to_omitting_fields_with_defaults(expect, pattern, root):
+            values = pattern.parse(str(root / "a" / ".yml"))
+            expect(values) == ["a"]
+
+        def it_returns_none_for_other_files(expect, pattern, root):
+            expect(pattern.parse(str(root / "a.json"))).is_(None)
+
+        def it_supports_format_specifications(expect, root):
+            pattern = PathPattern(MyClass, "../tmp/{self.count:d}.yml")
+            expect(pattern.parse(str(root / "42.yml"))) == [42]
+
+
+def describe_get_pattern():
+    def it_shares_patterns_per_class(expect):
+        pattern = get_pattern(MyClass, "{self.key}.yml")
+        expect(get_pattern(MyClass, "{self.key}.yml")).is_(pattern)
+        expect(get_pattern(MyClass, "{self.name}.yml")).is_not(pattern)
@@ -1,8 +1,20 @@
 # pylint: disable=unused-variable
 
-from typing import Dict
-
-from datafiles.utils import recursive_update
+import os
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+from datafiles.types import Missing
+from datafiles.utils import (
+    copy_data,
+    get_default_field_value,
+    get_default_field_values,
+    is_ambiguous,
+    recursive_update,
+    stat,
+    write,
+)
 
 
 def describe_recursive_update():
@@ -99,3 +111,99 @@ def describe_recursive_update():
             recursive_update(old, new)
 
             expect(old) == new
+
+
+def describe_copy_data():
+    def with_nested_containers(expect):
+        value = {"a": [1, {"b": 2}]}
+
+        data = copy_data(value)
+
+        expect(data) == value
+        expect(data["a"]).is_not(value["a"])
+
+    def with_defaultdict(expect):
+        value = defaultdict(list, {"a": [1]})
+
+        data = copy_data(value)
+
+        expect(data) == {"a": [1]}
+        expect(data["a"]).is_not(value["a"])
+
+
+def describe_get_default_field_values():
+    @dataclass
+    class Sample:
+        required: int
+        value: int = 42
+        items: List[int] = field(default_factory=lambda: [1, 2])
+        computed: int = field(init=False, default=0)
+
+    def it_builds_a_table_once_per_class(expect):
+        defaults = get_default_field_values(Sample)
+
+        expect(defaults) == {"value": 42, "items": [1, 2], "computed": 0}
+        expect(get_default_field_values(Sample)).is_(defaults)
+
+    def it_looks_up_single_fields(expect):
+        sample = Sample(1)
+
+        expect(get_default_field_value(sample, "value")) == 42
+        expect(get_default_field_value(sample, "required")).is_(Missing)
+
+
+def describe_is_ambiguous():
+    def when_checked_in_the_same_tick(expect):
+        expect(is_ambiguous((1_000_000_123, 0, 0), 1_000_000_456)).is_(True)
+
+    def when_checked_later(expect):
+        expect(is_ambiguous((1_000_000_123, 0, 0), 2_000_000_000)).is_(False)
+
+    def with_coarse_timestamps(expect):
+        expect(is_ambiguous((1_000_000_000, 0, 0), 1_500_000_000)).is_(True)
+
+
+def describe_stat():
+    def it_returns_none_for_missing_files(expect, tmp_path):
+        expect(stat(tmp_path / "missing.yml")).is_(None)
+
+    def it_reuses_recent_results(expect, tmp_path, mocker):
+        path = tmp_path / "sample.yml"
+        path.write_text("a: 1")
+        spy = mocker.spy(os, "stat")
+
+        key = stat(path, ttl=60)
+
+        expect(stat(path, ttl=60)) == key
+        expect(spy.call_count) == 1
+
+    def it_forgets_results_after_writes(expect, tmp_path):
+        path = tmp_path / "sample.yml"
+        path.write_text("a: 1")
+        key = stat(path, ttl=60)
+
+        write(path, "a: 42")
+
+        expect(stat(path, ttl=60)) != key
+
+
+def describe_write():
+    def it_replaces_files_atomically(expect, tmp_path):
+        path = tmp_path / "sample.yml"
+        path.write_text("a: 1")
+
+        write(path, "a: 42", atomic=True)
+
+        expect(path.read_text()) == "a: 42"
+        expect(os.listdir(tmp_path)) == ["sample.yml"]
+
+    def it_removes_temporary_files_on_errors(expect, tmp_path, mocker):
+        path = tmp_path / "sample.yml"
+        path.write_text("a: 1")
+        mocker.patch.object(os, "replace", side_effect=OSError)
+
+        with expect.raises(OSError):
+            write(path, "a: 42", atomic=True)
+
+        expect(path.read_text()) == "a: 1"
+        expect(os.listdir(tmp_path)) == ["sample.yml"]
@@ -0,0 +1,131 @@
+# pylint: disable=unused-variable
+
+import time
+
+import pytest
+
+from datafiles import settings
+from datafiles.writer import Writer
+
+
+def describe_writer():
+    @pytest.fixture
+    def writer():
+        writer = Writer()
+        yield writer
+        writer.stop()
+
+    @pytest.fixture
+    def mapper(mocker):
+        return mocker.Mock(_dirty=False)
+
+    def describe_schedule():
+        def it_marks_mappers_dirty(expect, writer, mapper):
+            writer.schedule(mapper)
+
+            expect(mapper._dirty).is_(True)
+            expect(len(writer)) == 1
+
+        def it_coalesces_repeated_changes(expect, writer, mapper, monkeypatch):
+            monkeypatch.setattr(settings, "WRITE_BEHIND_DELAY", 60)
+
+            writer.schedule(mapper)
+            writer.schedule(mapper)
+
+            expect(len(writer)) == 1
+            expect(mapper.save.call_count) == 0
+
+        def it_saves_synchronously_when_full(expect, writer, mocker, monkeypatch):
+            monkeypatch.setattr(settings, "WRITE_BEHIND_DELAY", 60)
+            monkeypatch.setattr(settings, "WRITE_BEHIND_LIMIT", 2)
+            mappers = [mocker.Mock(_dirty=False) for _ in range(3)]
+
+            for mapper in mappers:
+                writer.schedule(mapper)
+
+            expect(len(writer)) == 1
+            expect(mappers[0].save.call_count) == 1
+            expect(mappers[1].save.call_count) == 1
+            expect(mappers[2].save.call_count) == 0
+
+    def describe_flush():
+        def it_saves_pending_mappers(expect, writer, mapper, monkeypatch):
+            monkeypatch.setattr(settings, "WRITE_BEHIND_DELAY", 60)
+            writer.schedule(mapper)
+
+            writer.flush()
+
+            expect(len(writer)) == 0
+            expect(mapper.save.call_count) == 1
+
+        def it_ignores_clean_mappers(expect, writer, mapper):
+            writer.flush(mapper)
+
+            expect(mapper.save.call_count) == 0
+
+        def it_keeps_mappers_that_fail_to_save(expect, writer, mapper, monkeypatch):
+            monkeypatch.setattr(settings, "WRITE_BEHIND_DELAY", 60)
+            mapper.save.side_effect = OSError("disk full")
+            writer.schedule(mapper)
+
+            writer.flush()
+
+            expect(len(writer)) == 1
+            expect(mapper._dirty).is_(True)
+
+        def it_waits_longer_after_each_failure(expect, writer, mapper, monkeypatch):
+            monkeypatch.setattr(settings, "WRITE_BEHIND_DELAY", 1)
+            monkeypatch.setattr(settings, "WRITE_BEHIND_LATENCY", 60)
+            mapper.save.side_effect = OSError("disk full")
+            writer.schedule(mapper)
+
+            writer.flush()
+            mappers, timeout = writer._collect(time.monotonic())
+
+            expect(mappers) == []
+            expect(timeout) > 1.5
+
+            writer.flush()
+            mappers, timeout = writer._collect(time.monotonic())
+
+            expect(mappers) == []
+            expect(timeout) > 3.5
+
+    def describe_discard():
+        def it_forgets_pending_saves(expect, writer, mapper, monkeypatch):
+            monkeypatch.setattr(settings, "WRITE_BEHIND_DELAY", 60)
+            writer.schedule(mapper)
+
+            writer.discard(mapper)
+
+            expect(mapper._dirty).is_(True)
+            expect(len(writer)) == 0
+
+    def describe_stop():
+        def it_ends_the_background_thread(expect, writer, mapper, monkeypatch):
+            monkeypatch.setattr(settings, "WRITE_BEHIND_DELAY", 60)
+            writer.schedule(mapper)
+            thread = writer._thread
+
+            writer.stop()
+
+            expect(thread.is_alive()).is_(False)
+            expect(len(writer)) == 1
+
+    def describe_release():
+        def it_marks_mappers_clean(expect, writer, mapper, monkeypatch):
+            monkeypatch.setattr(settings, "WRITE_BEHIND_DELAY", 60)
+            writer.schedule(mapper)
+            writer.discard(mapper)
+
+            writer.release(mapper)
+
+            expect(mapper._dirty).is_(False)
+
+        def it_keeps_mappers_changed_while_saving(expect, writer, mapper, monkeypatch):
+            monkeypatch.setattr(settings, "WRITE_BEHIND_DELAY", 60)
+            writer.schedule(mapper)
+
+            writer.release(mapper)
+
+            expect(mapper._dirty).is_(True)
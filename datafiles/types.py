@@ -1,9 +1,11 @@
 import dataclasses
-from typing import Optional
+from typing import Any, Generic, Optional, Tuple, Type, TypeVar
 
 Trilean = Optional[bool]
 Missing = dataclasses._MISSING_TYPE
 
+T = TypeVar("T")
+
 
 class List(list):
     """Patchable `list` type."""
@@ -31,3 +33,86 @@ class Dict(dict):
     @classmethod
     def to_yaml(cls, representer, node):
         return representer.represent_dict(node)
+
+
+def _refuse(self, *_args, **_kwargs):
+    raise TypeError(f"Cannot modify read-only '{type(self).__name__}' object")
+
+
+class FrozenList(list):
+    """Read-only `list` type."""
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _refuse
+    append = extend = insert = remove = pop = clear = sort = reverse = _refuse
+
+    def __reduce_ex__(self, protocol):
+        return self.__class__, (list(self),)
+
+    @classmethod
+    def to_yaml(cls, representer, node):
+        return representer.represent_list(node)
+
+
+class FrozenDict(dict):
+    """Read-only `dict` type."""
+
+    __setitem__ = __delitem__ = __ior__ = _refuse
+    clear = pop = popitem = setdefault = update = _refuse
+
+    def __reduce_ex__(self, protocol):
+        return self.__class__, (dict(self),)
+
+    @classmethod
+    def to_yaml(cls, representer, node):
+        return representer.represent_dict(node)
+
+
+class Ref(Generic[T]):
+    """Reference to another model's object, loaded on first attribute access."""
+
+    __slots__ = ("_model", "_key", "_object")
+
+    def __init__(self, model: Type[T], key: Tuple[Tuple[str, Any], ...]):
+        object.__setattr__(self, "_model", model)
+        object.__setattr__(self, "_key", key)
+        object.__setattr__(self, "_object", None)
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{name}={value!r}" for name, value in self._key)
+        return f"Ref[{self._model.__name__}]({values})"
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, Ref):
+            return self._model is other._model and self._key == other._key
+        if isinstance(other, self._model):
+            return all(getattr(other, name) == value for name, value in self._key)
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((self._model, self._key))
+
+    def __getattr__(self, name: str):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self._resolve(), name)
+
+    def __setattr__(self, name: str, value):
+        setattr(self._resolve(), name, value)
+
+    def __copy__(self) -> "Ref[T]":
+        return Ref(self._model, self._key)
+
+    def __deepcopy__(self, memo) -> "Ref[T]":
+        return Ref(self._model, self._key)
+
+    def _resolve(self, cache: Optional[dict] = None) -> T:
+        if self._object is None:
+            key = self._model, self._key
+            if cache is None or key not in cache:
+                instance = self._model.objects.get(**dict(self._key))  # type: ignore
+                if cache is not None:
+                    cache[key] = instance
+            else:
+                instance = cache[key]
+            object.__setattr__(self, "_object", instance)
+        return self._object  # type: ignore
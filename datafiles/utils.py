@@ -1,22 +1,34 @@
 """Internal helper functions."""
 
+import copy
 import dataclasses
+import hashlib
+import logging
+import os
 import time
 from contextlib import suppress
 from dataclasses import Field
 from functools import lru_cache
 from pathlib import Path
 from pprint import pformat
-from shutil import get_terminal_size
-from typing import Any, Dict, Union
+from shutil import copymode, get_terminal_size
+from threading import get_ident
+from typing import Any, Dict, Optional, Tuple, Union
 
 import log
 
 from . import settings
-from .types import Missing
+from .types import FrozenDict, FrozenList, Missing
 
 cached = lru_cache()
 
+StatKey = Tuple[int, int, int]
+
+MTIME_RESOLUTION = 10_000_000  # nanoseconds, coarse kernel clocks tick every 1-10 ms
+
+_STATS: Dict[Path, Tuple[float, Optional[StatKey]]] = {}
+_STATS_LIMIT = 4096
+
 
 def subclasses(cls):
     return set(cls.__subclasses__()).union(
@@ -25,18 +37,30 @@ def subclasses(cls):
 
 
 def get_default_field_value(instance, name):
-    for field in dataclasses.fields(instance):
-        if field.name == name:
-            if not isinstance(field.default, Missing):
-                return field.default
+    default = get_default_field_values(instance.__class__).get(name, Missing)
+    if default is _INITIALIZED:
+        return getattr(instance, name)
+    return default
+
+
+@cached
+def get_default_field_values(cls: type) -> Dict[str, Any]:
+    """Build a table of default values for each field of a dataclass."""
+    defaults: Dict[str, Any] = {}
+    for field in dataclasses.fields(cls):
+        if not isinstance(field.default, Missing):
+            defaults[field.name] = field.default
+
+        elif not isinstance(field.default_factory, Missing):  # type: ignore
+            defaults[field.name] = _call_default_factory(field)
+
+        elif not field.init and hasattr(cls, "__post_init__"):
+            defaults[field.name] = _INITIALIZED
 
-            if not isinstance(field.default_factory, Missing):  # type: ignore
-                return _call_default_factory(field)
+    return defaults
 
-            if not field.init and hasattr(instance, "__post_init__"):
-                return getattr(instance, name)
 
-    return Missing
+_INITIALIZED = object()
 
 
 @cached
@@ -63,7 +87,7 @@ def dictify(value):
     return value
 
 
-def recursive_update(old: Dict, new: Dict) -> Dict:
+def recursive_update(old: Optional[Dict], new: Dict) -> Dict:
     """Recursively update a dictionary, keeping equivalent objects."""
     return _merge(old, new)
 
@@ -99,6 +123,55 @@ def _merge(old: Any, new: Any) -> Any:
     return new
 
 
+def copy_data(value: Any) -> Any:
+    """Deep copy a value, converting dataclasses to dictionaries like `asdict`."""
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+
+    if isinstance(value, tuple) and hasattr(value, "_fields"):
+        return type(value)(*[copy_data(item) for item in value])
+
+    if isinstance(value, (list, tuple)):
+        items = [copy_data(item) for item in value]
+        try:
+            return type(value)(items)
+        except TypeError:  # subclass with a different constructor
+            return tuple(items) if isinstance(value, tuple) else items
+
+    if isinstance(value, dict):
+        pairs = [(copy_data(key), copy_data(item)) for key, item in value.items()]
+        try:
+            return type(value)(pairs)
+        except TypeError:  # subclass with a different constructor, e.g. defaultdict
+            return dict(pairs)
+
+    return copy.deepcopy(value)
+
+
+def freeze(value: Any) -> Any:
+    """Replace containers with read-only ones, including in nested dataclasses."""
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        for field in dataclasses.fields(value):
+            with suppress(AttributeError):  # deferred fields are loaded later
+                item = object.__getattribute__(value, field.name)
+                object.__setattr__(value, field.name, freeze(item))
+        return value
+
+    if isinstance(value, list):
+        return FrozenList(freeze(item) for item in value)
+
+    if isinstance(value, dict):
+        return FrozenDict((key, freeze(item)) for key, item in value.items())
+
+    if isinstance(value, set):
+        return frozenset(value)
+
+    if type(value) is tuple:  # pylint: disable=unidiomatic-typecheck
+        return tuple(freeze(item) for item in value)
+
+    return value
+
+
 def dedent(text: str) -> str:
     """Remove indentation from a multiline string."""
     text = text.strip("\n")
@@ -106,8 +179,63 @@ def dedent(text: str) -> str:
     return text.replace("    " * indent, "")
 
 
-def write(filename_or_path: Union[str, Path], text: str, *, display=False) -> None:
-    """Write text to a given file and optionally log it."""
+def fingerprint(text: str) -> str:
+    """Summarize text to detect changes without keeping a copy."""
+    return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+
+
+def stat(path: Path, ttl: float = 0.0) -> Optional[StatKey]:
+    """Get a file's identity, reusing results newer than the given seconds."""
+    now = time.monotonic()
+    if ttl:
+        with suppress(KeyError):
+            checked, key = _STATS[path]
+            if now - checked < ttl:
+                return key
+
+    try:
+        result = os.stat(path)
+    except FileNotFoundError:
+        key = None
+    else:
+        key = (result.st_mtime_ns, result.st_size, result.st_ino)
+
+    if ttl:
+        if len(_STATS) >= _STATS_LIMIT:
+            _STATS.clear()
+        _STATS[path] = now, key
+
+    return key
+
+
+def is_ambiguous(key: StatKey, checked: int) -> bool:
+    """Determine if a file could change again without changing its stat key.
+
+    File systems record modification times at a limited resolution, so a write
+    within the same tick as the last check can leave `st_mtime_ns` unchanged.
+    Timestamps that are whole milliseconds or seconds indicate coarser clocks.
+    """
+    mtime = key[0]
+    resolution = MTIME_RESOLUTION
+    while resolution < 1_000_000_000 and mtime % (resolution * 10) == 0:
+        resolution *= 10
+    return checked - mtime < 2 * resolution
+
+
+def write(
+    filename_or_path: Union[str, Path],
+    text: str,
+    *,
+    display=False,
+    atomic=False,
+    sync=False,
+) -> None:
+    """Write text to a given file and optionally log it.
+
+    With `atomic=True`, the text is written to a temporary file that then
+    replaces the original. With `sync=True`, the contents are flushed to
+    disk before returning (or before replacing the original).
+    """
     if isinstance(filename_or_path, Path):
         path = filename_or_path
     else:
@@ -126,8 +254,40 @@ def write(filename_or_path: Union[str, Path], text: str, *, display=False) -> No
         log.critical(message)
 
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(text)
-    time.sleep(settings.WRITE_DELAY)  # ensure the file modification time changes
+    if atomic:
+        temp = path.with_name(f".{path.name}.{os.getpid()}.{get_ident()}.tmp")
+        try:
+            _write_text(temp, text, sync=sync)
+            with suppress(FileNotFoundError):
+                copymode(path, temp)
+            os.replace(temp, path)
+        except BaseException:
+            temp.unlink(missing_ok=True)
+            raise
+    else:
+        _write_text(path, text, sync=sync)
+    _STATS.pop(path, None)
+    if settings.WRITE_DELAY:
+        time.sleep(settings.WRITE_DELAY)
+
+
+def _write_text(path: Path, text: str, *, sync: bool) -> None:
+    with path.open("w") as file:
+        file.write(text)
+        if sync:
+            file.flush()
+            os.fsync(file.fileno())
+
+
+def sync_directory(path: Path) -> None:
+    """Flush a directory's entries to disk so replaced files survive crashes."""
+    if not hasattr(os, "O_DIRECTORY"):
+        return  # directories cannot be opened for syncing on Windows
+    fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
 
 
 def read(filename: str, *, display=False) -> str:
@@ -149,6 +309,8 @@ def read(filename: str, *, display=False) -> str:
 
 def display(path: Path, data: Dict) -> None:
     """Display data read from a file."""
+    if not logging.getLogger(__name__).isEnabledFor(logging.DEBUG):
+        return
     message = f"Data from file: {path}"
     line = "=" * (31 + len(message))
     content = prettify(data)
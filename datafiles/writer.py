@@ -0,0 +1,171 @@
+"""Defines a background writer to coalesce automatic saves."""
+
+from __future__ import annotations
+
+import atexit
+import threading
+import time
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+import log
+
+from . import settings
+
+if TYPE_CHECKING:
+    from .mapper import Mapper
+
+
+class Writer:
+    """Write-behind queue that saves each dirty mapper once per burst of changes.
+
+    Saves hold `lock` while serializing, so changes to write-behind objects
+    acquire it as well to never be written half-applied.
+    """
+
+    def __init__(self) -> None:
+        self._pending: Dict[Mapper, Tuple[float, float]] = {}
+        self._failures: Dict[Mapper, Tuple[int, float]] = {}
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = False
+        self.lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def schedule(self, mapper: Mapper) -> None:
+        """Mark a mapper dirty and defer its save until changes settle."""
+        with self._condition:
+            full = mapper not in self._pending and (
+                len(self._pending) >= settings.WRITE_BEHIND_LIMIT
+            )
+
+        if full:
+            log.debug(f"Flushing {len(self._pending)} pending writes to make room")
+            self.flush()
+
+        with self._condition:
+            now = time.monotonic()
+            first, _last = self._pending.get(mapper, (now, now))
+            self._pending[mapper] = (first, now)
+            mapper._dirty = True  # pylint: disable=protected-access
+
+            self._start()
+            self._condition.notify_all()
+
+    def flush(self, mapper: Optional[Mapper] = None) -> None:
+        """Save one or all pending mappers immediately."""
+        with self._condition:
+            if mapper is None:
+                mappers = list(self._pending)
+                self._pending.clear()
+            elif self._pending.pop(mapper, None):
+                mappers = [mapper]
+            else:
+                mappers = []
+
+        self._save(mappers)
+
+    def discard(self, mapper: Mapper) -> None:
+        """Forget a pending save because the mapper is being saved directly."""
+        with self._condition:
+            self._pending.pop(mapper, None)
+            self._failures.pop(mapper, None)
+
+    def release(self, mapper: Mapper) -> None:
+        """Mark a saved mapper clean unless it changed again while saving."""
+        with self._condition:
+            if mapper not in self._pending:
+                mapper._dirty = False  # pylint: disable=protected-access
+
+    def stop(self) -> None:
+        """Stop the background thread without saving pending mappers."""
+        with self._condition:
+            thread = self._thread
+            self._stopping = True
+            self._condition.notify_all()
+
+        if thread:
+            thread.join()
+
+        with self._condition:
+            self._thread = None
+            self._stopping = False
+
+    def _start(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        self._thread = threading.Thread(
+            target=self._run, name="datafiles-writer", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._pending and not self._stopping:
+                    self._condition.wait()
+
+                if self._stopping:
+                    return
+
+                mappers, timeout = self._collect(time.monotonic())
+                if not mappers:
+                    self._condition.wait(timeout=timeout)
+                    continue
+
+            self._save(mappers)
+
+    def _collect(self, now: float) -> Tuple[List[Mapper], float]:
+        delay = settings.WRITE_BEHIND_DELAY
+        latency = settings.WRITE_BEHIND_LATENCY
+
+        mappers = []
+        timeout = latency
+        for mapper, (first, last) in list(self._pending.items()):
+            remaining = min(last + delay, first + latency) - now
+            if mapper in self._failures:
+                remaining = max(remaining, self._failures[mapper][1] - now)
+            if remaining <= 0:
+                mappers.append(mapper)
+                del self._pending[mapper]
+            else:
+                timeout = min(timeout, remaining)
+
+        return mappers, timeout
+
+    def _save(self, mappers: List[Mapper]) -> None:
+        with self.lock:
+            for mapper in mappers:
+                try:
+                    mapper.save(_log=False, _parts=False)
+                except Exception as e:  # pylint: disable=broad-except
+                    log.error(f"Unable to save '{mapper.classname}' object: {e}")
+                    self._retry(mapper)
+                else:
+                    with self._condition:
+                        self._failures.pop(mapper, None)
+
+    def _retry(self, mapper: Mapper) -> None:
+        # Keep failed changes pending so they are neither lost nor reloaded over,
+        # but wait longer after each failure to avoid retrying in a tight loop
+        with self._condition:
+            now = time.monotonic()
+            count = self._failures.get(mapper, (0, now))[0] + 1
+            backoff = settings.WRITE_BEHIND_DELAY * 2**count
+            backoff = min(backoff, settings.WRITE_BEHIND_BACKOFF)
+            self._failures[mapper] = count, now + backoff
+            if mapper not in self._pending:
+                self._pending[mapper] = (now, now)
+                self._condition.notify_all()
+
+
+writer = Writer()
+
+
+def flush() -> None:
+    """Save all objects with pending automatic changes."""
+    writer.flush()
+
+
+atexit.register(flush)
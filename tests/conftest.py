@@ -7,7 +7,6 @@ import pytest
 from datafiles import settings
 
 settings.HIDDEN_TRACEBACK = False
-settings.WRITE_DELAY = 0.1
 
 
 def pytest_configure(config):
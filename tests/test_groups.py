@@ -0,0 +1,115 @@
+"""Tests for models with fields grouped into separate files."""
+
+# pylint: disable=unused-variable
+
+import os
+from typing import List
+
+from datafiles import datafile, field
+from datafiles.utils import dedent, logbreak, read, write
+
+
+@datafile("../tmp/groups/{self.key}.yml")
+class Task:
+    key: str
+    status: str = "new"
+    count: int = 0
+    description: str = ""
+    history: List[str] = field(default_factory=list)
+
+    class Meta:
+        datafile_groups = {"cold": ["description", "history"]}
+
+
+def describe_saving():
+    def it_writes_grouped_fields_to_separate_files(expect):
+        Task("a", count=1, description="foo", history=["bar"])
+
+        expect(read("tmp/groups/a.yml")) == dedent("""
+        count: 1
+        """)
+        expect(read("tmp/groups/a.cold.yml")) == dedent("""
+        description: foo
+        history:
+          - bar
+        """)
+
+    def it_only_rewrites_the_file_of_a_changed_field(expect):
+        task = Task("b", history=["bar"])
+        modified = os.stat("tmp/groups/b.cold.yml").st_mtime_ns
+
+        logbreak("Setting attribute")
+        task.count += 1
+
+        expect(read("tmp/groups/b.yml")) == dedent("""
+        count: 1
+        """)
+        expect(os.stat("tmp/groups/b.cold.yml").st_mtime_ns) == modified
+
+    def it_saves_nested_changes_to_the_grouped_file(expect):
+        task = Task("c")
+
+        logbreak("Appending item")
+        task.history.append("bar")
+
+        expect(read("tmp/groups/c.cold.yml")) == dedent("""
+        history:
+          - bar
+        """)
+
+
+def describe_loading():
+    def it_reads_grouped_fields_from_separate_files(expect):
+        write("tmp/groups/d.yml", "status: done")
+        write("tmp/groups/d.cold.yml", "history: [foo]")
+
+        task = Task.objects.get("d")
+
+        expect(task.status) == "done"
+        expect(task.history) == ["foo"]
+
+    def it_reloads_grouped_files_changed_externally(expect):
+        task = Task("e")
+
+        write("tmp/groups/e.cold.yml", "description: foo")
+
+        expect(task.description) == "foo"
+
+    def it_moves_grouped_fields_out_of_existing_files(expect):
+        write(
+            "tmp/groups/f.yml",
+            """
+            status: done
+            description: foo
+            """,
+        )
+
+        task = Task.objects.get("f")
+        expect(task.description) == "foo"
+
+        logbreak("Setting attribute")
+        task.count = 2
+
+        expect(read("tmp/groups/f.yml")) == dedent("""
+        status: done
+        count: 2
+        """)
+        expect(read("tmp/groups/f.cold.yml")) == dedent("""
+        description: foo
+        """)
+
+
+def describe_manager():
+    def it_skips_grouped_files_when_listing(expect):
+        Task("g", history=["foo"])
+
+        expect([task.key for task in Task.objects.all()]) == ["g"]
+
+    def it_defers_grouped_fields(expect):
+        Task("h", description="foo")
+
+        task = Task.objects.defer("description").get("h")
+
+        expect(task.datafile.deferred) == set()
+        expect(task.datafile.part("description").deferred) == {"description"}
+        expect(task.description) == "foo"
@@ -3,6 +3,7 @@
 # pylint: disable=unused-variable
 
 from dataclasses import FrozenInstanceError, dataclass, field
+from typing import List
 
 import pytest
 
@@ -501,3 +502,76 @@ def describe_sets():
         logbreak()
 
         expect(sample.items) == {_FrozenNestedSample1(name="abc", score=0.0)}
+
+
+def describe_stamps():
+    @datafile("../tmp/stamped/{self.key}.yml")
+    class SampleWithStamp:
+        key: int
+        items: List[_NestedSample1] = field(default_factory=list)
+
+        class Meta:
+            datafile_stamp = True
+
+    def with_stamped_file(expect, mocker):
+        sample = SampleWithStamp(1, [_NestedSample1("a", 1.5)])
+        expect(read("tmp/stamped/1.yml")).startswith(dedent("""
+                items:
+                  - name: a
+                    score: 1.5
+                # datafiles:
+                """).strip())
+
+        converter = sample.datafile.attrs["items"]
+        spy = mocker.spy(converter, "to_python_value")
+        sample = SampleWithStamp.objects.get(1)
+
+        expect(sample.items) == [_NestedSample1("a", 1.5)]
+        expect(spy.called).is_(False)
+
+    def with_edited_file(expect, mocker):
+        sample = SampleWithStamp(2, [_NestedSample1("a", 1.5)])
+        write("tmp/stamped/2.yml", read("tmp/stamped/2.yml").replace("1.5", "'2'"))
+
+        converter = sample.datafile.attrs["items"]
+        spy = mocker.spy(converter, "to_python_value")
+        sample = SampleWithStamp.objects.get(2)
+
+        expect(sample.items) == [_NestedSample1("a", 2.0)]
+        expect(spy.called).is_(True)
+
+    def with_saved_changes(expect):
+        sample = SampleWithStamp(3)
+
+        logbreak("Appending item")
+        sample.items.append(_NestedSample1("b", 0.5))
+
+        text = read("tmp/stamped/3.yml")
+        expect(text.splitlines()[-1]).startswith("# datafiles:")
+        expect(SampleWithStamp.objects.get(3).items) == [_NestedSample1("b", 0.5)]
+
+
+def describe_lean():
+    @datafile("../tmp/sample.yml")
+    class SampleLean:
+        items: List[_NestedSample1] = field(default_factory=list)
+
+        class Meta:
+            datafile_lean = True
+
+    def with_nested_values(expect):
+        write(
+            "tmp/sample.yml",
+            """
+            # Comment
+            items:
+              - name: a
+                score: 1.5
+            """,
+        )
+
+        sample = SampleLean()
+
+        expect(sample.items) == [_NestedSample1("a", 1.5)]
+        expect(type(sample.datafile._last_data)) == dict
+        expect(sample.datafile._last_cache).is_(None)
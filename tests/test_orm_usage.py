@@ -1,11 +1,13 @@
 """Tests that represent usage as an ORM."""
 
 import platform
+from dataclasses import field
+from pathlib import Path
 from typing import List, Optional
 
 import pytest
 
-from datafiles import datafile
+from datafiles import Session, datafile
 from datafiles.utils import logbreak, write
 
 from .samples import SampleWithNestingAndOptionals
@@ -134,6 +136,53 @@ def test_missing_optional_fields_are_loaded(expect):
     expect(sample2.name) == sample.name
 
 
+def test_lazy_instances_are_loaded_on_first_access(expect, mocker):
+    InventoryItem.objects.get_or_create(1, "Nuts", 0.23)
+    InventoryItem.objects.get_or_create(2, "Bolts", 0.45, quantity_on_hand=100)
+    read_text = mocker.spy(Path, "read_text")
+
+    logbreak("List lazy items")
+    items = {int(item.pk): item for item in InventoryItem.objects.lazy().all()}
+    expect(sorted(items)) == [1, 2]
+    expect(read_text.called).is_(False)
+
+    logbreak("Access lazy item")
+    expect(items[2].name) == "Bolts"
+    expect(items[2].quantity_on_hand) == 100
+    expect(read_text.called).is_(True)
+
+    logbreak("Modify lazy item")
+    items[1].quantity_on_hand = 5
+    expect(items[1].datafile.data) == {
+        "name": "Nuts",
+        "unit_price": 0.23,
+        "quantity_on_hand": 5,
+    }
+
+
+def test_deferred_fields_are_loaded_on_first_access(expect):
+    @datafile("../tmp/tasks/{self.key}.yml")
+    class Task:
+        key: str
+        name: str = ""
+        history: List[str] = field(default_factory=list)
+
+    Task("a", "Alpha", ["created", "started"])
+
+    logbreak("Load task without history")
+    task = Task.objects.defer("history").get("a")
+    expect(task.datafile.deferred) == {"history"}
+    expect(task.name) == "Alpha"
+
+    logbreak("Modify task without history")
+    task.name = "Beta"
+    expect(task.datafile.deferred) == set()
+    expect(task.datafile.data) == {
+        "name": "Beta",
+        "history": ["created", "started"],
+    }
+
+
 def test_comments_in_matched_files(expect):
     @datafile("../tmp/templates/{self.key}/config.yml")
     class LegacyTemplate:
@@ -202,3 +251,91 @@ def test_paths_in_pattern(expect):
         expect(items[-1].path) == "foo\\bar"
     else:
         expect(items[-1].path) == "foo/bar"
+
+
+def test_sessions_save_changed_objects_together(expect, mocker):
+    for pk in range(5):
+        InventoryItem(pk, f"Item {pk}", 1.0)
+    write_file = mocker.patch("datafiles.session.write", wraps=write)
+
+    with Session(workers=2) as session:
+        for item in InventoryItem.objects.filter(unit_price=1.0):
+            if item.name in {"Item 1", "Item 3"}:
+                item.quantity_on_hand = 10
+            item.unit_price = 1.0
+
+        expect(write_file.call_count) == 0
+
+    expect(write_file.call_count) == 2
+    expect(session.written) == 2
+    expect(session.skipped) == 3
+    expect(session.bytes_written) > 0
+
+    item = InventoryItem.objects.get(1)
+    expect(item.quantity_on_hand) == 10
+
+
+def test_sessions_discard_changes_on_errors(expect, mocker):
+    item = InventoryItem(42, "Item", 1.0)
+    write_file = mocker.patch("datafiles.session.write", wraps=write)
+
+    with expect.raises(RuntimeError):
+        with Session():
+            item.quantity_on_hand = 10
+            expect(item.datafile.dirty).is_(True)
+            raise RuntimeError
+
+    expect(write_file.call_count) == 0
+    expect(item.datafile.dirty).is_(False)
+
+    logbreak("Modifying file")
+    write(
+        "tmp/inventory/42.yml",
+        """
+        name: Item
+        unit_price: 2.0
+        """,
+    )
+
+    expect(item.unit_price) == 2.0
+
+
+def test_sessions_reload_unsaved_objects_after_write_errors(expect, mocker):
+    first = InventoryItem(43, "First", 1.0)
+    second = InventoryItem(44, "Second", 1.0)
+
+    def write_first_file_only(path, text, **kwargs):
+        if path.name == "44.yml":
+            raise OSError("disk full")
+        write(path, text, **kwargs)
+
+    mocker.patch("datafiles.session.write", side_effect=write_first_file_only)
+
+    with expect.raises(OSError):
+        with Session() as session:
+            first.quantity_on_hand = 10
+            second.quantity_on_hand = 20
+
+    expect(session.written) == 1
+    expect(first.datafile.dirty).is_(False)
+    expect(second.datafile.dirty).is_(False)
+    expect(first.datafile.modified).is_(False)
+
+    logbreak("Modifying files")
+    write(
+        "tmp/inventory/43.yml",
+        """
+        name: First
+        unit_price: 2.0
+        """,
+    )
+    write(
+        "tmp/inventory/44.yml",
+        """
+        name: Second
+        unit_price: 3.0
+        """,
+    )
+
+    expect(first.unit_price) == 2.0
+    expect(second.unit_price) == 3.0
@@ -0,0 +1,74 @@
+"""Tests for automatic saving and loading through field descriptors."""
+
+# pylint: disable=unused-variable
+
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+import pytest
+
+from datafiles import datafile, hooks
+
+from . import test_patched_methods
+
+
+@datafile("../tmp/sample.yml")
+class Sample:
+    item: str = "a"
+    items: List[int] = field(default_factory=lambda: [1])
+    data: Dict[str, int] = field(default_factory=lambda: {"a": 1})
+
+    class Meta:
+        datafile_hooks = "descriptors"
+
+
+@dataclass
+class Nested:
+    name: str = "b"
+    score: float = 3.4
+    items: List[int] = field(default_factory=list)
+
+
+@datafile("../tmp/sample.yml")
+class SampleWithNesting:
+    item: int
+    nested: Nested = field(default_factory=Nested)
+
+    class Meta:
+        datafile_hooks = "descriptors"
+
+
+@pytest.fixture(autouse=True)
+def use_descriptors(monkeypatch):
+    monkeypatch.setattr(test_patched_methods, "Sample", Sample)
+    monkeypatch.setattr(test_patched_methods, "SampleWithNesting", SampleWithNesting)
+
+
+describe_automatic_load = test_patched_methods.describe_automatic_load
+describe_automatic_save = test_patched_methods.describe_automatic_save
+describe_automatic_load_before_save = (
+    test_patched_methods.describe_automatic_load_before_save
+)
+describe_automatic_load_after_save = (
+    test_patched_methods.describe_automatic_load_after_save
+)
+
+
+def describe_descriptors():
+    def it_installs_descriptors_for_mapped_fields(expect):
+        sample = SampleWithNesting(1)
+
+        expect(type(SampleWithNesting.__dict__["nested"])) == hooks.FieldHook
+        expect(type(Nested.__dict__["name"])) == hooks.FieldHook
+        expect(sample.nested.name) == "b"
+
+    def it_leaves_attribute_lookup_unpatched(expect):
+        Sample()
+
+        expect(hasattr(Sample.__getattribute__, "_patched")).is_(False)
+        expect(hasattr(Sample.__setattr__, "_patched")).is_(False)
+
+    def it_keeps_class_defaults(expect):
+        Sample()
+
+        expect(Sample.item) == "a"
@@ -1,12 +1,21 @@
 """Tests for automatic saving and loading through patched methods."""
 
-# pylint: disable=unused-variable
+# pylint: disable=unused-variable,not-an-iterable,bad-reversed-sequence
 
+import os
+import threading
+import time
 from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Dict, List
 
-from datafiles import datafile
+import pytest
+
+import datafiles
+from datafiles import datafile, settings
+from datafiles.mapper import Mapper
 from datafiles.utils import dedent, logbreak, read, write
+from datafiles.writer import writer
 
 
 @datafile("../tmp/sample.yml")
@@ -16,6 +25,14 @@ class Sample:
     data: Dict[str, int] = field(default_factory=lambda: {"a": 1})
 
 
+@datafile("../tmp/sample.yml")
+class SampleWithStatTTL:
+    item: str = "a"
+
+    class Meta:
+        datafile_stat_ttl = 60
+
+
 @dataclass
 class Nested:
     name: str = "b"
@@ -29,6 +46,12 @@ class SampleWithNesting:
     nested: Nested = field(default_factory=Nested)
 
 
+@datafile("../tmp/sample.yml")
+class SampleWithNestedContainers:
+    mapping: Dict[str, Nested] = field(default_factory=dict)
+    items: List[Nested] = field(default_factory=list)
+
+
 def describe_automatic_load():
     def with_getattribute(expect):
         sample = Sample()
@@ -43,6 +66,53 @@ def describe_automatic_load():
         logbreak("Getting attribute")
         expect(sample.item) == "b"
 
+    def with_unchanged_values(expect):
+        sample = SampleWithNesting(1, Nested(items=[1, 2]))
+        nested = sample.nested
+        items = nested.items
+
+        write(
+            "tmp/sample.yml",
+            """
+            item: 2
+            nested:
+              items:
+                - 1
+                - 2
+            """,
+        )
+
+        logbreak("Getting changed attribute")
+        expect(sample.item) == 2
+        expect(id(sample.nested)) == id(nested)
+        expect(id(sample.nested.items)) == id(items)
+
+        write(
+            "tmp/sample.yml",
+            """
+            item: 2
+            nested:
+              name: c
+            """,
+        )
+
+        logbreak("Getting changed nested attribute")
+        expect(sample.nested.name) == "c"
+        expect(sample.nested.items) == []
+
+    def with_stat_ttl(expect, mocker):
+        sample = SampleWithStatTTL()
+        spy = mocker.spy(os, "stat")
+
+        for _ in range(10):
+            expect(sample.item) == "a"
+        expect(spy.call_count) <= 1
+
+        Path("tmp/sample.yml").write_text("item: b\n")
+
+        logbreak("Getting cached attribute")
+        expect(sample.item) == "a"
+
 
 def describe_automatic_save():
     def with_setattr(expect):
@@ -68,6 +138,20 @@ def describe_automatic_save():
               name: d
             """)
 
+    def with_setattr_on_nested_dataclass_from_init(expect):
+        nested = Nested()
+        sample = SampleWithNesting(2, nested)
+
+        logbreak("Setting nested attribute")
+        nested.name = "d"
+
+        expect(read("tmp/sample.yml")) == dedent("""
+            item: 2
+            nested:
+              name: d
+            """)
+        expect(sample.nested).is_(nested)
+
     def with_setitem(expect):
         sample = Sample()
 
@@ -136,6 +220,110 @@ def describe_automatic_save():
                 - 3
             """)
 
+    def with_setattr_on_nested_dict_values(expect):
+        sample = SampleWithNestedContainers({"a": Nested(), "b": Nested()})
+
+        for nested in sample.mapping.values():
+            nested.name = "c"
+
+        expect(read("tmp/sample.yml")) == dedent("""
+            mapping:
+              a:
+                name: c
+                score: 3.4
+                items: []
+              b:
+                name: c
+                score: 3.4
+                items: []
+            """)
+
+    def with_setattr_on_nested_dict_items(expect):
+        sample = SampleWithNestedContainers({"a": Nested(), "b": Nested()})
+
+        for _key, nested in sample.mapping.items():
+            nested.name = "c"
+
+        expect(read("tmp/sample.yml")) == dedent("""
+            mapping:
+              a:
+                name: c
+                score: 3.4
+                items: []
+              b:
+                name: c
+                score: 3.4
+                items: []
+            """)
+
+    def with_setattr_on_nested_dict_get(expect):
+        sample = SampleWithNestedContainers({"a": Nested(), "b": Nested()})
+
+        sample.mapping.get("a").name = "c"  # type: ignore
+        sample.mapping.get("b").name = "c"  # type: ignore
+
+        expect(read("tmp/sample.yml")) == dedent("""
+            mapping:
+              a:
+                name: c
+                score: 3.4
+                items: []
+              b:
+                name: c
+                score: 3.4
+                items: []
+            """)
+
+    def with_setattr_on_list_items(expect):
+        sample = SampleWithNestedContainers(items=[Nested("a"), Nested("b")])
+
+        for nested in sample.items:
+            nested.score = 1.0
+
+        expect(read("tmp/sample.yml")) == dedent("""
+            items:
+              - name: a
+                score: 1.0
+                items:
+                  -
+              - name: b
+                score: 1.0
+                items:
+                  -
+            """)
+
+    def with_setattr_on_list_items_from_init(expect):
+        nested = Nested("a")
+        sample = SampleWithNestedContainers(items=[nested])
+
+        nested.score = 1.0
+
+        expect(read("tmp/sample.yml")) == dedent("""
+            items:
+              - name: a
+                score: 1.0
+                items:
+                  -
+            """)
+
+    def with_setattr_on_reversed_list_items(expect):
+        sample = SampleWithNestedContainers(items=[Nested("a"), Nested("b")])
+
+        for nested in reversed(sample.items):
+            nested.score = 1.0
+
+        expect(read("tmp/sample.yml")) == dedent("""
+            items:
+              - name: a
+                score: 1.0
+                items:
+                  -
+              - name: b
+                score: 1.0
+                items:
+                  -
+            """)
+
     def with_update(expect):
         sample = Sample()
 
@@ -190,3 +378,164 @@ def describe_automatic_load_after_save():
             """)
 
         expect(sample.item) == "42"
+
+
+def describe_write_behind():
+    @pytest.fixture(autouse=True)
+    def enable_write_behind(monkeypatch):
+        monkeypatch.setattr(settings, "WRITE_BEHIND", True)
+        monkeypatch.setattr(settings, "WRITE_BEHIND_DELAY", 60)
+        monkeypatch.setattr(settings, "WRITE_BEHIND_LATENCY", 60)
+        yield
+        datafiles.flush()
+
+    def it_coalesces_changes_into_one_write(expect, mocker):
+        sample = Sample()
+        write = mocker.spy(Mapper, "save")
+
+        logbreak("Setting attributes")
+        sample.item = "b"
+        sample.items.append(2)
+        sample.data.update({"b": 2})
+
+        expect(write.call_count) == 0
+        expect(sample.datafile.dirty).is_(True)
+        expect(read("tmp/sample.yml")) == ""
+
+        logbreak("Flushing changes")
+        datafiles.flush()
+
+        expect(write.call_count) == 1
+        expect(sample.datafile.dirty).is_(False)
+        expect(read("tmp/sample.yml")) == dedent("""
+            item: b
+            items:
+              - 1
+              - 2
+            data:
+              a: 1
+              b: 2
+            """)
+
+    def it_flushes_individual_objects(expect):
+        sample = SampleWithNesting(1)
+
+        sample.nested.name = "c"
+        sample.nested.datafile.flush()  # type: ignore
+
+        expect(read("tmp/sample.yml")) == dedent("""
+            item: 1
+            nested:
+              name: c
+            """)
+
+    def it_keeps_pending_changes_over_file_changes(expect):
+        sample = Sample()
+        sample.item = "b"
+
+        write("tmp/sample.yml", "item: c")
+
+        expect(sample.item) == "b"
+
+    def it_waits_for_background_saves_to_finish_changing(expect):
+        sample = Sample()
+        changed = threading.Event()
+
+        def change():
+            sample.item = "b"
+            changed.set()
+
+        with writer.lock:
+            thread = threading.Thread(target=change)
+            thread.start()
+            expect(changed.wait(0.05)).is_(False)
+
+        thread.join()
+        expect(sample.datafile.dirty).is_(True)
+
+        datafiles.flush()
+
+        expect(read("tmp/sample.yml")) == dedent("""
+            item: b
+            """)
+
+    def it_saves_after_a_quiet_period(expect, monkeypatch):
+        monkeypatch.setattr(settings, "WRITE_BEHIND_DELAY", 0.01)
+        sample = Sample()
+
+        sample.item = "b"
+        for _ in range(100):
+            if not sample.datafile.dirty:
+                break
+            time.sleep(0.01)
+
+        expect(sample.datafile.dirty).is_(False)
+        expect(read("tmp/sample.yml")) == dedent("""
+            item: b
+            """)
+
+
+def describe_transaction():
+    def it_saves_once_on_exit(expect, mocker):
+        sample = Sample()
+        spy = mocker.spy(Mapper, "save")
+
+        with sample.datafile.transaction():
+            sample.item = "b"
+            sample.items.append(2)
+            sample.data["b"] = 2
+
+            expect(read("tmp/sample.yml")) == ""
+
+        expect(spy.call_count) == 1
+        expect(read("tmp/sample.yml")) == dedent("""
+            item: b
+            items:
+              - 1
+              - 2
+            data:
+              a: 1
+              b: 2
+            """)
+
+    def it_restores_the_object_on_errors(expect):
+        sample = Sample()
+        sample.item = "b"
+
+        with expect.raises(RuntimeError):
+            with sample.datafile.transaction():
+                sample.item = "c"
+                sample.items.append(2)
+                raise RuntimeError
+
+        expect(sample.item) == "b"
+        expect(sample.items) == [1]
+        expect(read("tmp/sample.yml")) == dedent("""
+            item: b
+            """)
+
+    def it_only_affects_the_given_object(expect):
+        @datafile("../tmp/other.yml")
+        class Other:
+            item: str = "a"
+
+        sample = SampleWithNesting(1)
+        other = Other()
+
+        with sample.datafile.transaction():
+            sample.nested.name = "c"
+            other.item = "b"
+
+            expect(read("tmp/sample.yml")) == dedent("""
+                item: 1
+                nested: {}
+                """)
+            expect(read("tmp/other.yml")) == dedent("""
+                item: b
+                """)
+
+        expect(read("tmp/sample.yml")) == dedent("""
+            item: 1
+            nested:
+              name: c
+            """)
@@ -1,5 +1,8 @@
 """Tests used to profile the library."""
 
+import gc
+import logging
+import tracemalloc
 from dataclasses import dataclass, field
 from typing import List, Optional
 
@@ -43,3 +46,29 @@ def test_save():
     sample = get_sample()
     logbreak("Saving")
     sample.datafile.save()  # pylint: disable=no-member
+
+
+def test_mutations():
+    sample = get_sample()
+    logbreak("Mutating")
+    for value in range(10):
+        sample.item_required.default = value
+
+
+def test_memory(expect):
+    sample = get_sample()
+    Sample = sample.__class__
+    Item = sample.item_required.__class__
+
+    gc.collect()
+    logging.disable()  # captured log records would be counted otherwise
+    tracemalloc.start()
+    try:
+        samples = [Sample("profiling", Item(2, None), None, []) for _ in range(100)]
+        size, _peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+        logging.disable(logging.NOTSET)
+
+    logbreak(f"Memory: {size // len(samples)} bytes per instance")
+    expect(size // len(samples)) < 20_000
@@ -0,0 +1,150 @@
+"""Tests for models that are only read from files."""
+
+# pylint: disable=unused-variable
+
+from dataclasses import FrozenInstanceError, dataclass
+from pathlib import Path
+from threading import Thread
+from typing import List
+
+import pytest
+
+from datafiles import Model, datafile, field
+from datafiles.utils import write
+
+
+@datafile("../tmp/readonly/{self.key}.yml", readonly=True)
+class Item:
+    key: str
+    count: int = 0
+    tags: List[str] = field(default_factory=list)
+
+
+def describe_instantiation():
+    def it_does_not_create_missing_files(expect):
+        item = Item("a")
+
+        expect(item.count) == 0
+        expect(Path("tmp/readonly/a.yml").exists()).is_(False)
+
+    def it_loads_existing_files(expect):
+        write("tmp/readonly/b.yml", "count: 2")
+
+        item = Item("b")
+
+        expect(item.count) == 2
+
+
+def describe_changes():
+    def it_returns_immutable_instances():
+        write("tmp/readonly/c.yml", "count: 2")
+        item = Item.objects.get("c")
+
+        with pytest.raises(FrozenInstanceError):
+            item.count = 3  # type: ignore[misc]
+
+    def it_returns_immutable_containers(expect):
+        write("tmp/readonly/h.yml", "tags: [a]")
+        item = Item.objects.get("h")
+
+        with expect.raises(TypeError, "Cannot modify read-only 'FrozenList' object"):
+            item.tags.append("b")
+
+        expect(item.tags) == ["a"]
+        expect(Item.objects.get("h")).is_(item)
+
+    def it_loads_into_new_containers(expect):
+        write("tmp/readonly/i.yml", "count: 2")
+        write("tmp/readonly/j.yml", "tags: [a]")
+        item = Item.objects.get("i")
+
+        other = Item("j", tags=item.tags)
+
+        expect(other.tags) == ["a"]
+        expect(item.tags) == []
+
+
+def describe_validation():
+    def it_requires_frozen_dataclasses():
+        @dataclass
+        class Existing:
+            key: str
+
+            class Meta:
+                datafile_readonly = True
+
+        with pytest.raises(ValueError, match="must be a frozen dataclass"):
+            datafile("../tmp/readonly/{self.key}.yml")(Existing)
+
+    def it_requires_frozen_model_subclasses():
+        @dataclass
+        class Subclass(Model):
+            key: str
+
+            class Meta:
+                datafile_pattern = "../tmp/readonly/{self.key}.yml"
+                datafile_readonly = True
+
+        with pytest.raises(ValueError, match="must be a frozen dataclass"):
+            Subclass("k")
+
+    def it_requires_frozen_nested_dataclasses():
+        @dataclass
+        class Nested:
+            value: int = 0
+
+        with pytest.raises(ValueError, match="must only contain frozen dataclasses"):
+
+            @datafile("../tmp/readonly/{self.key}.yml", readonly=True)
+            class Parent:
+                key: str
+                items: List[Nested] = field(default_factory=list)
+
+    def it_accepts_frozen_nested_dataclasses(expect):
+        @dataclass(frozen=True)
+        class Nested:
+            value: int = 0
+
+        @datafile("../tmp/readonly/{self.key}.yml", readonly=True)
+        class Parent:
+            key: str
+            nested: Nested = field(default_factory=Nested)
+
+        write("tmp/readonly/l.yml", "nested: {value: 2}")
+
+        expect(Parent.objects.get("l").nested) == Nested(2)
+
+
+def describe_manager():
+    def it_shares_unchanged_instances(expect):
+        write("tmp/readonly/e.yml", "count: 2")
+
+        item = Item.objects.get("e")
+
+        expect(Item.objects.get("e")).is_(item)
+        expect(list(Item.objects.all())[0]).is_(item)
+
+    def it_loads_changed_files_again(expect):
+        write("tmp/readonly/f.yml", "count: 2")
+        item = Item.objects.get("f")
+
+        write("tmp/readonly/f.yml", "count: 3")
+
+        expect(Item.objects.get("f")) == Item("f", 3)
+        expect(Item.objects.get("f")).is_not(item)
+
+    def it_shares_instances_across_threads(expect):
+        write("tmp/readonly/g.yml", "count: 2")
+        item = Item.objects.get("g")
+        results = []
+
+        def read():
+            results.append(Item.objects.get("g"))
+
+        threads = [Thread(target=read) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        expect(all(result is item for result in results)).is_(True)
@@ -0,0 +1,77 @@
+"""Tests for references between models."""
+
+# pylint: disable=unused-variable,protected-access
+
+from typing import List, Optional
+
+from datafiles import Ref, datafile, field
+from datafiles.utils import dedent, logbreak, read, write
+
+
+@datafile("../tmp/users/{self.key}.yml")
+class User:
+    key: str
+    name: str = ""
+
+
+@datafile("../tmp/tasks/{self.id}.yml")
+class Task:
+    id: int
+    owner: Optional[Ref[User]] = None
+    watchers: List[Ref[User]] = field(default_factory=list)
+
+
+def describe_saving():
+    def it_stores_placeholder_values(expect):
+        alice = User("alice", "Alice")
+        bob = User("bob", "Bob")
+
+        Task(1, alice, [alice, bob])  # type: ignore[arg-type, list-item]
+
+        expect(read("tmp/tasks/1.yml")) == dedent("""
+        owner: alice
+        watchers:
+          - alice
+          - bob
+        """)
+
+    def it_saves_changes_to_the_referenced_object(expect):
+        User("alice", "Alice")
+        write("tmp/tasks/2.yml", "owner: alice")
+        task = Task.objects.get(2)
+
+        logbreak("Setting attribute")
+        task.owner.name = "Alicia"
+
+        expect(read("tmp/users/alice.yml")) == dedent("""
+        name: Alicia
+        """)
+
+
+def describe_loading():
+    def it_resolves_references_on_first_access(expect, mocker):
+        User("alice", "Alice")
+        write("tmp/tasks/3.yml", "owner: alice")
+        get = mocker.spy(User.objects.__class__, "get")
+
+        task = Task.objects.get(3)
+        expect(task.owner) == Ref(User, (("key", "alice"),))
+        expect(get.call_count) == 1
+
+        expect(task.owner.name) == "Alice"
+        expect(task.owner.key) == "alice"
+        expect(get.call_count) == 2
+
+    def it_prefetches_references_together(expect):
+        User("alice", "Alice")
+        write("tmp/tasks/4.yml", "owner: alice\nwatchers: [alice]")
+        write("tmp/tasks/5.yml", "owner: alice")
+
+        tasks = sorted(
+            Task.objects.prefetch("owner", "watchers").all(), key=lambda t: t.id
+        )
+
+        owners = [task.owner._object for task in tasks]
+        expect(owners[0]) == User("alice", "Alice")
+        expect(owners[0]).is_(owners[1])
+        expect(tasks[0].watchers[0]._object).is_(owners[0])
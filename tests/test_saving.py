@@ -495,3 +495,35 @@ def describe_preservation():
             s2: 'e'
             s3: "f"
             """)
+
+    def with_lean_mode(expect):
+        @datafile("../tmp/sample.yml")
+        class Sample:
+            required: float
+            optional: Optional[float] = None
+
+            class Meta:
+                datafile_lean = True
+
+        write(
+            "tmp/sample.yml",
+            """
+            # Header
+            required: 1.0       # Line
+            optional: 2.0
+            """,
+        )
+
+        sample = Sample(1)
+        expect(sample.datafile._last_data) == {}
+
+        logbreak("Setting attribute")
+        sample.required = 3
+
+        expect(read("tmp/sample.yml")) == dedent("""
+            # Header
+            required: 3.0       # Line
+            optional: 2.0
+            """)
+        expect(sample.datafile._last_data) == {}
+        expect(sample.datafile._last_cache).is_(None)
@@ -0,0 +1,236 @@
+"""Tests for models and nested types using dataclasses with slots."""
+
+# pylint: disable=unused-variable,unsubscriptable-object
+
+from dataclasses import FrozenInstanceError, dataclass, field
+from typing import List, Optional
+
+import pytest
+
+from datafiles import datafile
+from datafiles.utils import dedent, logbreak, read, write
+
+
+@dataclass(slots=True)
+class NestedSample:
+    name: str
+    score: float = 0.0
+
+
+@datafile("../tmp/sample.yml", manual=True, slots=True)
+class SampleWithDefaults:
+    foo: int = 1
+    bar: str = "a"
+    items: List[str] = field(default_factory=list)
+
+
+@datafile("../tmp/sample.yml", manual=True, slots=True)
+class SampleWithNesting:
+    nested: NestedSample
+    name: str = ""
+
+
+@datafile("../tmp/sample.yml", slots=True)
+class SampleWithListOfDataclasses:
+    items: List[NestedSample] = field(default_factory=list)
+    name: Optional[str] = None
+
+
+@datafile("../tmp/sample.yml", slots=True, frozen=True)
+class SampleFrozen:
+    key: int = 1
+    name: str = "a"
+
+
+@datafile("../tmp/slots/{self.key}.yml", slots=True)
+class SampleWithDescriptors:
+    key: str
+    name: str = ""
+    items: List[NestedSample] = field(default_factory=list)
+
+    class Meta:
+        datafile_hooks = "descriptors"
+
+
+def it_has_no_instance_dictionary(expect):
+    sample = SampleWithDefaults()
+
+    expect(hasattr(sample, "__dict__")).is_(False)
+    expect(sample.datafile.path.name) == "sample.yml"
+
+
+def describe_instantiation():
+    def with_existing_file(expect):
+        write(
+            "tmp/sample.yml",
+            """
+            foo: 2
+            bar: b
+            """,
+        )
+
+        sample = SampleWithDefaults()
+
+        expect(sample.foo) == 2
+        expect(sample.bar) == "b"
+
+    def with_init_values(expect):
+        write(
+            "tmp/sample.yml",
+            """
+            foo: 3
+            bar: c
+            items: ["aaa"]
+            """,
+        )
+
+        sample = SampleWithDefaults(4, "d", ["aaa", "bbb"])
+
+        expect(sample.foo) == 4
+        expect(sample.bar) == "d"
+        expect(sample.items) == ["aaa", "bbb"]
+
+    def with_nested_value(expect):
+        write(
+            "tmp/sample.yml",
+            """
+            nested:
+              name: foo
+              score: 7
+            """,
+        )
+
+        sample = SampleWithNesting(NestedSample("", 0.0))
+        sample.datafile.load()
+
+        expect(sample.nested) == NestedSample("foo", 7.0)
+
+    def without_existing_file(expect):
+        sample = SampleWithListOfDataclasses([NestedSample("a", 1.5)])
+
+        expect(read("tmp/sample.yml")) == dedent("""
+        items:
+          - name: a
+            score: 1.5
+        """)
+        expect(sample.datafile.exists).is_(True)
+
+
+def describe_loading():
+    def with_list_of_dataclasses(expect):
+        sample = SampleWithListOfDataclasses()
+
+        write(
+            "tmp/sample.yml",
+            """
+            items:
+              - name: a
+                score: 1
+              - name: b
+            """,
+        )
+
+        logbreak("Getting attribute")
+        expect(sample.items) == [NestedSample("a", 1.0), NestedSample("b", 0.0)]
+
+    def with_existing_nested_object(expect):
+        nested = NestedSample("", 0.0)
+        sample = SampleWithNesting(nested)
+
+        write(
+            "tmp/sample.yml",
+            """
+            nested:
+              name: foo
+            """,
+        )
+
+        sample.datafile.load()
+
+        expect(sample.nested).is_(nested)
+        expect(nested.name) == "foo"
+
+    def with_frozen_instance(expect):
+        write(
+            "tmp/sample.yml",
+            """
+            key: 2
+            name: b
+            """,
+        )
+
+        sample = SampleFrozen()
+
+        expect(sample.name) == "b"
+        with pytest.raises(FrozenInstanceError):
+            sample.name = "c"  # type: ignore[misc]
+
+    def with_manager(expect):
+        SampleWithDescriptors("a", "foo", [NestedSample("b")])
+
+        sample = SampleWithDescriptors.objects.get("a")
+
+        expect(sample.name) == "foo"
+        expect(sample.items) == [NestedSample("b")]
+
+    def with_deferred_fields(expect):
+        SampleWithDescriptors("a", "foo", [NestedSample("b")])
+
+        sample = SampleWithDescriptors.objects.defer("items").get("a")
+
+        expect(sample.datafile.deferred) == {"items"}
+        expect(sample.items) == [NestedSample("b")]
+
+
+def describe_saving():
+    def with_list_append(expect):
+        sample = SampleWithListOfDataclasses()
+
+        logbreak("Appending item")
+        sample.items.append(NestedSample("a"))
+
+        expect(read("tmp/sample.yml")) == dedent("""
+        items:
+          - name: a
+            score: 0.0
+        """)
+
+    def with_descriptors(expect):
+        sample = SampleWithDescriptors("a")
+
+        logbreak("Setting attribute")
+        sample.name = "foo"
+
+        expect(read("tmp/slots/a.yml")) == dedent("""
+        name: foo
+        """)
+
+    def with_nested_field_change(expect, caplog):
+        @dataclass(slots=True)
+        class Nested:
+            name: str
+
+        @datafile("../tmp/sample.yml", slots=True)
+        class Sample:
+            items: List[Nested] = field(default_factory=list)
+
+        sample = Sample([Nested("a")])
+
+        logbreak("Setting nested attributes")
+        sample.items[0].name = "b"
+        sample.items[0].name = "c"
+
+        expect(read("tmp/sample.yml")) == dedent("""
+        items:
+          - name: a
+        """)
+        warnings = [r for r in caplog.records if r.levelname == "WARNING"]
+        expect(len(warnings)) == 1
+
+        logbreak("Saving model")
+        sample.datafile.save()
+
+        expect(read("tmp/sample.yml")) == dedent("""
+        items:
+          - name: c
+        """)